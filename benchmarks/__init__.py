@@ -0,0 +1,12 @@
+"""
+Headless benchmarks of the canvas, clustering and render hot paths.
+
+    python -m benchmarks -o results.json
+    python -m benchmarks -o new.json --baseline results.json
+    python -m benchmarks --compare results.json new.json
+"""
+import os
+
+# set before pygame is imported, so the suite runs without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,82 @@
+from . import suite
+import argparse
+import json
+import platform
+import sys
+import time
+
+def environment() -> dict:
+    import numpy as np
+    import pygame
+    return {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def compare(baseline: dict, current: dict, threshold: float, floor: float) -> list[str]:
+    """
+    Print the median of every case found in both result files and return the regressed ones:
+    slower by more than threshold (relative) and by more than floor seconds.
+    """
+    base, new = baseline["results"], current["results"]
+    regressions = []
+    print(f"{'case':<44} {'baseline':>12} {'current':>12} {'change':>8}")
+    for key in sorted(base.keys() & new.keys()):
+        before, after = base[key]["median"], new[key]["median"]
+        change = after / before - 1 if before else 0.0
+        regressed = change > threshold and after - before > floor
+        flag = "  REGRESSION" if regressed else ("  faster" if change < -threshold else "")
+        print(f"{key:<44} {before * 1000:10.3f}ms {after * 1000:10.3f}ms {change:+8.1%}{flag}")
+        if regressed:
+            regressions.append(key)
+    missing = base.keys() - new.keys()
+    if missing:
+        print(f"{len(missing)} baseline case(s) were not run")
+    return regressions
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the canvas, clustering and render hot paths headless.")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="where to write the results (JSON)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=suite.SIZES, help="numbers of points")
+    parser.add_argument("-k", "--clusters", type=int, nargs="+", default=suite.KS, help="values of k")
+    parser.add_argument("--only", nargs="+", help="run only the cases whose name contains one of these")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to spend per case")
+    parser.add_argument("--max-repeat", type=int, default=20, help="most runs per case")
+    parser.add_argument("--baseline", help="results to compare the new run against")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two result files without running anything")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative slowdown reported as a regression (default 0.15)")
+    parser.add_argument("--floor", type=float, default=50e-6,
+                        help="ignore slowdowns smaller than this many seconds (default 50us)")
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.compare:
+        with open(args.compare[0]) as f, open(args.compare[1]) as g:
+            baseline, current = json.load(f), json.load(g)
+    else:
+        results = suite.Suite(args.sizes, args.clusters, args.min_time, args.max_repeat, args.only).run()
+        current = {"environment": environment(), "results": results}
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"Wrote {len(results)} result(s) to {args.output}")
+        if not args.baseline:
+            return 0
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = compare(baseline, current, args.threshold, args.floor)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+The benchmark cases. Every case runs against a real App on the dummy video driver, so a
+"frame" is the same App.frame() the event loop calls.
+"""
+from modules.app import App
+from modules.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+from modules.prewarm import Prewarmer
+import statistics
+import time
+import numpy as np
+import pygame
+
+SIZES = (1000, 10000, 100000, 1000000)
+KS = (3, 8)
+
+def make_points(n: int, seed: int = 0, n_blobs: int = 8) -> np.ndarray:
+    """Gaussian blobs inside the 600x600 canvas, the same for every run."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(100, 500, (n_blobs, 2))
+    xy = centers[rng.integers(n_blobs, size=n)] + rng.normal(0, 40, (n, 2))
+    return np.clip(xy, 1, 598)
+
+def measure(fn, setup=None, min_time: float = 0.5, max_repeat: int = 20, ops: int = 1) -> dict:
+    """
+    Time fn() until min_time has been spent or max_repeat runs were made (at least one).
+    setup() runs untimed before every run; times are per operation when fn does ops of them.
+    """
+    times = []
+    while len(times) < max_repeat and (not times or sum(times) < min_time):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) / ops)
+    return {"median": statistics.median(times), "min": min(times), "repeat": len(times)}
+
+class Suite:
+    def __init__(self, sizes=SIZES, ks=KS, min_time: float = 0.5, max_repeat: int = 20,
+                 only: list[str] | None = None, log=print):
+        self.sizes = sizes
+        self.ks = ks
+        self.min_time = min_time
+        self.max_repeat = max_repeat
+        self.only = only
+        self.log = log
+        self.results = {}
+
+    def _case(self, name: str, n: int, k: int | None, fn, setup=None, ops: int = 1) -> None:
+        if self.only and not any(pattern in name for pattern in self.only):
+            return
+        key = f"{name}/n={n}" + (f"/k={k}" if k is not None else "")
+        result = measure(fn, setup, self.min_time, self.max_repeat, ops)
+        self.results[key] = result
+        self.log(f"{key:<44} {result['median'] * 1000:10.3f} ms  (min {result['min'] * 1000:.3f}, "
+                 f"{result['repeat']} run(s))")
+
+    def run(self) -> dict:
+        pygame.init()
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        app = App(screen)
+        canvas = app.canvas
+        # same warm-up as the application, so no case pays for imports or the process pool
+        prewarmer = Prewarmer(canvas.kmeans_backend, n_points=max(self.sizes))
+        prewarmer.start()
+        prewarmer.join()
+        rng = np.random.default_rng(1)
+        try:
+            for n in self.sizes:
+                self._run_size(app, n, rng)
+        finally:
+            pygame.quit()
+        return self.results
+
+    def _run_size(self, app: App, n: int, rng: np.random.Generator) -> None:
+        canvas = app.canvas
+        screen = app.renderer.screen
+        canvas.load_points(make_points(n), fit_to_canvas=False)
+        canvas.boundary_mode = None
+        app.update_points_info()
+        app.frame([])
+
+        # adding points, before any clustering
+        queries = rng.uniform(0, 600, (256, 2)).astype(int).tolist()
+        self._case("get_point_near", n, None, lambda: [canvas.get_point_near(q) for q in queries], ops=len(queries))
+        self._case("draw", n, None, lambda: canvas.draw(screen))
+        clicks = iter(rng.uniform(1, 598, (100000, 2)).astype(int).tolist())
+        self._case("draw_after_add", n, None, lambda: canvas.draw(screen),
+                   setup=lambda: canvas.add_point(tuple(next(clicks))))
+        self._case("frame_click", n, None, lambda: app.frame(
+            [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(next(clicks)), button=1)]))
+
+        for k in self.ks:
+            if len(canvas.points) < k:
+                continue
+            app.set_k(k)
+            canvas.boundary_mode = None
+            self._case("run_kmeans", n, k, lambda: canvas.run_kmeans(k, warm_start=False))
+            if not hasattr(canvas, "centroids"):
+                canvas.run_kmeans(k, warm_start=False)
+            self._case("run_kmeans_warm", n, k, lambda: canvas.run_kmeans(k, warm_start=True))
+            # set_clusters stands for a new result with the same labels, dropping every per-result cache
+            new_result = lambda: canvas.set_clusters(canvas.centroids)
+            self._case("update_cluster_labels", n, k, app.update_cluster_labels, setup=new_result)
+            self._case("draw_clusters_boundary[hull]", n, k,
+                       lambda: canvas.draw_clusters_boundary(screen, "hull"), setup=new_result)
+
+            def moved_centroids():
+                # regions are keyed on the centroid coordinates, which set_clusters keeps
+                canvas._regions_key = None
+            self._case("draw_clusters_boundary[regions]", n, k,
+                       lambda: canvas.draw_clusters_boundary(screen, "regions"), setup=moved_centroids)
+            # a new coloring rebuilds the point or density layer; later draws reuse it
+            recolor = lambda: canvas.points.set_colors(canvas.points.colors.copy())
+            self._case("draw_recolored", n, k, lambda: canvas.draw(screen), setup=recolor)
+            self._case("draw_clustered", n, k, lambda: canvas.draw(screen))
+            app.frame([])
+            self._case("frame_idle", n, k, lambda: app.frame([]))
+            canvas.boundary_mode = "hull"
+
+            def exposed():
+                new_result()
+                app.renderer.invalidate()
+            self._case("frame_full[hull]", n, k, lambda: app.frame([]), setup=exposed)
+
+        # about one cold run_kmeans from 100k points on; a few times one below that, where the
+        # 2 x k_max fits of the sweep outweigh the n_init restarts at a single k
+        self._case("run_auto_k", n, None, canvas.run_auto_k)
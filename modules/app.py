@@ -0,0 +1,289 @@
+"""
+The visualizer window content: widgets, their callbacks and one main-loop frame. run_game
+drives App.frame() from the event loop; the benchmarks drive it headless.
+"""
+from .constants import COLOR, SESSION_PATH, PROFILER, WINDOW_WIDTH, WINDOW_HEIGHT
+from .drawer import Text, Button, Label, Canvas, ProfilerOverlay, SweepChart
+from .eventrouter import EventRouter
+from .profiler import FrameProfiler
+from .renderer import RetainedRenderer
+from .utils import show_msg, LEVEL
+from .worker import ClusterWorker, KMEANS_DONE
+import pygame
+
+BOUNDARY_MODES = [None, "hull", "regions"]
+
+class App:
+    def __init__(self, screen: pygame.Surface, worker: ClusterWorker | None = None):
+        self.renderer = RetainedRenderer(screen, COLOR["background"])
+        self.run_button = Button((620, 20), (150, 50), COLOR["primary"], Text("Run", 20, (0, 0), COLOR["black"]))
+        self.boundary_button = Button((620, 80), (150, 50), COLOR["steel_blue"],
+                                      Text("Boundary: Off", 20, (0, 0), COLOR["black"]))
+        self.remove_button = Button((620, 150), (150, 50), COLOR["warning"],
+                                    Text("Remove Last Point", 20, (0, 0), COLOR["black"]))
+        self.clear_button = Button((620, 210), (150, 50), COLOR["secondary"],
+                                   Text("Clear Canvas", 20, (0, 0), COLOR["black"]))
+        self.k_inc_button = Button((730, 275), (40, 40), COLOR["add"], Text("+", 30, (0, 0)))
+        self.k_dec_button = Button((620, 275), (40, 40), COLOR["warning"], Text("-", 30, (0, 0)))
+        self.live_button = Button((780, 20), (110, 50), COLOR["silver"], Text("Live: Off", 20, (0, 0), COLOR["black"]))
+        self.animate_button = Button((780, 80), (110, 50), COLOR["silver"], Text("Animate", 20, (0, 0), COLOR["black"]))
+        self.save_button = Button((780, 150), (110, 50), COLOR["add"], Text("Save", 20, (0, 0), COLOR["black"]))
+        self.load_button = Button((780, 210), (110, 50), COLOR["add"], Text("Load", 20, (0, 0), COLOR["black"]))
+        self.auto_k_button = Button((780, 270), (110, 50), COLOR["primary"], Text("Auto k", 20, (0, 0), COLOR["black"]))
+        self.buttons = [self.run_button, self.boundary_button, self.remove_button, self.clear_button,
+                        self.k_inc_button, self.k_dec_button, self.live_button, self.animate_button,
+                        self.save_button, self.load_button, self.auto_k_button]
+
+        self.k = 3
+        self.k_label = Label(f"k = {self.k}", 24, (670, 280))
+        self.points_info_label = Label("Points: 0", 20, (620, 340))
+        self.cluster_labels = []
+
+        self.canvas = Canvas((0, 0), (600, 600), COLOR["white"])
+        self.canvas.worker = worker
+        # curves of the last Auto k sweep, over the bottom-left corner of the canvas
+        self.sweep_chart = SweepChart((8, 442), (250, 150))
+        # per-phase frame timing; F3 toggles it together with its HUD
+        self.profiler = FrameProfiler()
+        self.canvas.profiler = self.profiler
+        self.profiler_overlay = ProfilerOverlay(self.profiler, (WINDOW_WIDTH - 5, WINDOW_HEIGHT - 5))
+        self.running = True
+        self._hover_version = None
+        self._kmeans_running = False
+        self._animating = False
+
+        self.save_button.connect("clicked", self.save_canvas)
+        self.load_button.connect("clicked", self.load_canvas)
+        self.run_button.connect("clicked", self.run_kmeans_on_canvas)
+        self.remove_button.connect("clicked", self.canvas.remove_last_point)
+        self.clear_button.connect("clicked", self.canvas.clear_canvas)
+        self.k_inc_button.connect("clicked", self.increase_k)
+        self.k_dec_button.connect("clicked", self.decrease_k)
+        self.live_button.connect("clicked", self.toggle_live)
+        self.animate_button.connect("clicked", self.toggle_animation)
+        self.boundary_button.connect("clicked", self.toggle_boundary)
+        self.auto_k_button.connect("clicked", self.run_auto_k)
+
+        # mouse events reach only the element under the cursor (and the one it left)
+        self.router = EventRouter()
+        self.router.register(self.canvas, self.canvas_event)
+        for btn in self.buttons:
+            self.router.register(btn)
+
+    @property
+    def elements(self) -> list:
+        elements = self.buttons + [self.k_label, self.points_info_label, *self.cluster_labels, self.canvas]
+        if self.sweep_chart.sweep is not None:
+            elements.append(self.sweep_chart)
+        return elements + [self.profiler_overlay] if self.profiler.enabled else elements
+
+    @property
+    def busy(self) -> bool:
+        """True while a background fit or the animation needs frames at full rate."""
+        return self.canvas.kmeans_running or self.canvas.animating
+
+    def update_cluster_labels(self) -> None:
+        stats = self.canvas.cluster_stats()
+        if stats is None:
+            self.cluster_labels.clear()
+            return
+        k_clusters = len(stats.sizes)
+        colors = self.canvas.cluster_colors
+        # existing labels are updated in place, so unchanged lines are not re-rendered
+        del self.cluster_labels[k_clusters:]
+        for i in range(k_clusters):
+            color = colors[i % len(colors)] if stats.sizes[i] else COLOR["black"]
+            cx, cy = stats.centroids[i]
+            text = f"C{i+1}: {stats.sizes[i]} point(s) - Centroid: ({int(cx)}, {int(cy)})"
+            if i < len(self.cluster_labels):
+                self.cluster_labels[i].set_color(color)
+                self.cluster_labels[i].text = text
+            else:
+                self.cluster_labels.append(Label(text, 20, (620, 360 + i * 24), color=color))
+
+    def update_points_info(self) -> None:
+        self.points_info_label.text = f"Points: {len(self.canvas.points)}"
+        sweep = self.canvas.k_sweep
+        if sweep is not self.sweep_chart.sweep:
+            # a finished sweep applies the k it chose
+            self.sweep_chart.sweep = sweep
+            if sweep is not None:
+                self.set_k(sweep.best_k)
+        self.update_cluster_labels()
+
+    def set_k(self, k: int) -> None:
+        self.k = k
+        self.k_label.text = f"k = {k}"
+
+    def save_canvas(self) -> None:
+        from .session import save_session
+        try:
+            save_session(self.canvas, SESSION_PATH)
+        except (OSError, ValueError) as e:
+            show_msg(LEVEL["ERROR"], f"Could not save session: {e}")
+
+    def load_canvas(self, path: str = SESSION_PATH) -> None:
+        from .session import load_session
+        self.canvas.cancel_animation()
+        if self.canvas.live:
+            self.canvas.set_live(False)
+            self.live_button.set_text("Live: Off")
+        try:
+            header = load_session(self.canvas, path)
+        except (OSError, ValueError, KeyError) as e:
+            show_msg(LEVEL["ERROR"], f"Could not load session: {e}")
+            return
+        if header.get("k"):
+            self.set_k(header["k"])
+        self.boundary_button.set_text(f"Boundary: {(self.canvas.boundary_mode or 'off').capitalize()}")
+        self.update_points_info()
+
+    def open_points_file(self, points_file: str) -> None:
+        """A saved session, an .npz with points (and labels/centroids) or any point file the CLI reads."""
+        # e.g. the .npz written by "python -m modules.kmeans_cli --stream", which holds a sample
+        from .kmeans_cli import load_points
+        from .session import is_session
+        import numpy as np
+        if is_session(points_file):
+            self.load_canvas(points_file)
+            return
+        try:
+            # load_points reads (and checks) the "points" array of an .npz, or its first one
+            points = load_points(points_file)
+            labels = centroids = None
+            if points_file.lower().endswith(".npz"):
+                with np.load(points_file) as data:
+                    labels, centroids = data.get("labels"), data.get("centroids")
+            self.canvas.load_points(points, labels, centroids)
+        except (OSError, ValueError, KeyError) as e:
+            show_msg(LEVEL["ERROR"], f"Could not open '{points_file}': {e}")
+            return
+        self.update_points_info()
+
+    def run_kmeans_on_canvas(self) -> None:
+        self.canvas.run_kmeans_async(k=self.k)
+        self.update_points_info()
+
+    def run_auto_k(self) -> None:
+        self.canvas.cancel_animation()
+        if self.canvas.live:
+            self.canvas.set_live(False)
+            self.live_button.set_text("Live: Off")
+        self.canvas.run_auto_k_async()
+        self.update_points_info()
+
+    def refit_after_k_change(self) -> None:
+        # warm-started refits are cheap, so keep the shown clustering in sync with k
+        if self.canvas.live:
+            self.canvas.set_live(True, self.k)
+            self.update_points_info()
+        elif self.canvas.warm_start and hasattr(self.canvas, "centroids"):
+            self.run_kmeans_on_canvas()
+
+    def change_k(self, k: int) -> None:
+        self.set_k(k)
+        self.canvas.cancel_kmeans()
+        self.canvas.cancel_animation()
+        # the sweep chart marks the k the sweep chose, which is no longer the one shown
+        self.canvas.k_sweep = None
+        self.update_points_info()
+        self.refit_after_k_change()
+
+    def increase_k(self) -> None:
+        if self.k < 10:
+            self.change_k(self.k + 1)
+
+    def decrease_k(self) -> None:
+        if self.k > 1:
+            self.change_k(self.k - 1)
+
+    def toggle_live(self) -> None:
+        self.canvas.cancel_animation()
+        self.canvas.set_live(not self.canvas.live, self.k)
+        self.live_button.set_text("Live: On" if self.canvas.live else "Live: Off")
+        self.update_points_info()
+
+    def toggle_animation(self) -> None:
+        if self.canvas.animating:
+            self.canvas.cancel_animation()
+            return
+        if self.canvas.live:
+            self.canvas.set_live(False)
+            self.live_button.set_text("Live: Off")
+        self.canvas.start_kmeans_animation(self.k)
+
+    def toggle_boundary(self) -> None:
+        mode = BOUNDARY_MODES[(BOUNDARY_MODES.index(self.canvas.boundary_mode) + 1) % len(BOUNDARY_MODES)]
+        self.canvas.boundary_mode = mode
+        self.boundary_button.set_text(f"Boundary: {(mode or 'off').capitalize()}")
+
+    def toggle_profiler(self) -> None:
+        self.profiler.set_enabled(not self.profiler.enabled)
+        self.profiler_overlay.mark_dirty()
+
+    def export_profile(self, path: str = PROFILER["export_path"]) -> None:
+        """Write the profiler samples, if it ever ran."""
+        if not self.profiler.has_samples():
+            return
+        try:
+            self.profiler.export(path)
+        except OSError as e:
+            show_msg(LEVEL["ERROR"], f"Could not export the profile: {e}")
+            return
+        show_msg(LEVEL["SUCCESS"], f"Frame profile written to {path}")
+
+    def update_hover(self, pos: tuple[int, int]) -> None:
+        self.canvas.hovered_point_index = self.canvas.get_point_near(pos)
+        self._hover_version = self.canvas.version
+
+    def canvas_event(self, event: pygame.event.Event, pos: tuple[int, int]) -> None:
+        self.canvas.update(pos)
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.canvas.add_point(pos)
+            self.update_points_info()
+        self.update_hover(pos)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        canvas = self.canvas
+        if self.router.dispatch(event):
+            return
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.renderer.invalidate()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.toggle_profiler()
+        elif event.type == KMEANS_DONE:
+            self.profiler.record("kmeans fit", event.seconds)
+            if canvas.handle_kmeans_event(event):
+                self.update_points_info()
+
+    def frame(self, events) -> bool:
+        """Handle the events, advance fits and the animation, and redraw what changed. Returns running."""
+        canvas = self.canvas
+        profiler = self.profiler
+        profiler.begin_frame()
+        for event in self.router.coalesce(events):
+            self.handle_event(event)
+        if canvas.version != self._hover_version:
+            # the points changed under a resting cursor
+            self.update_hover(self.router.mouse_pos)
+        profiler.lap("events")
+        if canvas.kmeans_running != self._kmeans_running:
+            self._kmeans_running = canvas.kmeans_running
+            self.run_button.set_text("Running..." if self._kmeans_running else "Run")
+        if canvas.step_animation():
+            self.update_points_info()
+        profiler.lap("animation")
+        if canvas.animating != self._animating:
+            self._animating = canvas.animating
+            self.animate_button.set_text("Stop" if self._animating else "Animate")
+        if profiler.enabled:
+            self.profiler_overlay.update()
+        profiler.lap("update")
+
+        # only elements that changed are redrawn and pushed to the display
+        self.renderer.render(self.elements)
+        profiler.lap("render")
+        profiler.end_frame()
+        return self.running
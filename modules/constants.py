@@ -173,4 +173,77 @@ COLOR = {
 
 FPS = 60
 WINDOW_WIDTH = 900
-WINDOW_HEIGHT = 600
\ No newline at end of file
+WINDOW_HEIGHT = 600
+GRID_CELL_SIZE = 10     # spatial index cell size in pixels, about the hover radius
+DENSITY_THRESHOLD = 100000  # from this many points the canvas draws a density image instead of circles
+TEXT_CACHE_SIZE = 256   # rendered text surfaces kept by the shared LRU cache
+SESSION_PATH = "session.kmsession"  # bundle written by the Save button and read by Load
+
+# Colors assigned to clusters, in label order
+CLUSTER_COLORS = [
+    COLOR["red"],
+    COLOR["lime"],
+    COLOR["blue"],
+    COLOR["cyan"],
+    COLOR["magenta"],
+    COLOR["orange"],
+    COLOR["green_yellow"],
+    COLOR["deep_pink"],
+    COLOR["steel_blue"],
+    COLOR["brown"],
+]
+
+# K-means defaults
+KMEANS = {
+    "backend"           : "numpy",      # "numpy" or "sklearn"
+    "algorithm"         : "lloyd",      # "lloyd" or "hamerly" (bound-accelerated)
+    "n_init"            : 10,
+    "max_iter"          : 300,
+    "tol"               : 1e-4,
+    "seed"              : None,
+    "warm_start"        : True,         # reseed from the previous centroids after edits or a k change
+    "warm_start_max_edits": 0.1,        # edited share of the points above which Run fits cold again
+    "live_refit_every"  : 200,          # points added in live mode between full refits
+    "chunk_size"        : 65536,        # rows per distance block
+    "n_jobs"            : -1,           # processes for parallel restarts, -1 = all cores
+    "parallel_min_points": 50000,       # below this, restarts run in-process
+}
+
+
+# Automatic choice of k
+AUTO_K = {
+    "k_max"             : 10,           # sweep k = 1..k_max, the same cap as the +/- buttons
+    "sample_size"       : 2000,         # points the silhouette is estimated on
+    "fit_sample_size"   : 20000,        # larger inputs are swept on a sample, then refined in full
+    "parallel_min_points": 10000,       # below this, the k fits of a sweep run in-process
+}
+
+
+# Out-of-core k-means over point files read in chunks
+STREAMING = {
+    "chunk_size"        : 262144,       # rows read and clustered at a time
+    "sample_size"       : 20000,        # reservoir sample used for seeding and display
+    "n_epochs"          : 1,            # mini-batch passes over the file
+}
+
+# Step-by-step k-means animation
+ANIMATION = {
+    "frame_budget_ms"   : 6,            # max time spent advancing the animation per frame
+    "step_interval_ms"  : 350,          # min time between visible assign/update steps
+}
+
+# Frame scheduling: full rate while the user interacts or work is running, then block on events
+SCHEDULER = {
+    "max_fps"           : FPS,
+    "idle_fps"          : 2,            # wake-ups per second while idle
+    "idle_after_ms"     : 500,          # quiet time before dropping to the idle rate
+    "idle_poll_ms"      : 30,           # queue checks while idle on drivers without a native wait
+}
+
+# Frame profiler and its HUD (toggled with F3)
+PROFILER = {
+    "enabled"           : False,
+    "capacity"          : 600,          # samples kept per phase, about 10 s at full rate
+    "hud_refresh_ms"    : 250,          # how often the HUD numbers are recomputed
+    "export_path"       : "profile.csv",  # samples written on exit (.csv or .json) if any were taken
+}
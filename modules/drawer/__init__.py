@@ -2,5 +2,7 @@ from .text import Text
 from .button import Button
 from .canvas import Canvas
 from .label import Label
+from .profileroverlay import ProfilerOverlay
+from .sweepchart import SweepChart
 
-__all__ = ["Text", "Button", "Canvas", "Label"]
+__all__ = ["Text", "Button", "Canvas", "Label", "ProfilerOverlay", "SweepChart"]
@@ -1 +1 @@
-from ..uielement import UIElement, Optional, COLOR, show_msg
+from ..uielement import UIElement, Optional, COLOR, show_msg, LEVEL
@@ -18,6 +18,22 @@ class Button(UIElement):
             show_msg(2, f"Failed to load image '{path}': {e}")
             self._image = None
 
+    def set_text(self, value):
+        """Replace the button caption and keep it centered."""
+        if self._text:
+            self._text.text = value
+            self._text._rect.size = self._text.rendered_text.get_size()
+            self._center_text()
+            self._dirty = True
+
+    @property
+    def dirty(self):
+        return self._dirty or (self._text is not None and self._text.dirty)
+
+    def mark_clean(self):
+        super().mark_clean()
+        if self._text: self._text.mark_clean()
+
     def _center_text(self):
         if self._text:
             self._text._rect.center = self._rect.center
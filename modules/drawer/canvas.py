@@ -1,139 +1,545 @@
-from .base import UIElement, COLOR
+from .base import UIElement, COLOR, show_msg, LEVEL
+from ..constants import KMEANS, AUTO_K, CLUSTER_COLORS, ANIMATION, DENSITY_THRESHOLD
+from ..geometry import convex_hull, nearest_centroid_grid
+from ..kmeans import (ClusterStats, KMeans, KMeansResult, KSweep, OnlineKMeans, assign_labels, cluster_stats,
+                      kmeans_plusplus, lloyd_steps, resize_centroids, sweep_k)
+from ..pointstore import PointStore
+from ..profiler import FrameProfiler
+from .density import DensityLayer
+from .fonts import get_font, render_text
+from .pointlayer import PointLayer
+import numpy as np
 import pygame
+import time
 
 class Canvas(UIElement):
     def __init__(self, position, size, color=COLOR["white"]):
         super().__init__(position, color)
         self.size = size
         self._rect = pygame.Rect(*position, *size)
-        self.points: list[tuple[int, int, tuple[int, int, int]]] = []
+        self.points = PointStore()
+        self.point_layer = PointLayer(size)
+        self.density_layer = DensityLayer(size)
+        self.density_threshold = DENSITY_THRESHOLD
         self.hover_color = COLOR["light_gray"]
         self.point_hover_color = COLOR["black"]
         self.hovered_point_index = None
+        self.boundary_mode = None  # None, "hull" or "regions"
+        self._drawn_key = None
+        self.profiler = FrameProfiler(enabled=False)  # replaced by the application's profiler
+        self.kmeans_backend = KMEANS["backend"]
+        self.kmeans_algorithm = KMEANS["algorithm"]
+        self.warm_start = KMEANS["warm_start"]
+        self.cluster_colors = list(CLUSTER_COLORS)
+        # live mode: points are clustered online as they are added
+        self.live = False
+        self.live_k = 3
+        self.live_refit_every = KMEANS["live_refit_every"]
+        self._online = None
+        self._live_added = 0
+        # background clustering; set to a ClusterWorker to keep fits off the event loop
+        self.worker = None
+        self.version = 0          # bumped on every point change
+        self._edit_version = 0    # bumped on removals and clears only
+        self._result_version = 0  # bumped whenever labels or centroids are replaced
+        self._edited = 0          # points added or removed since the last result
+        self._hulls = None
+        self._hulls_key = None
+        self._stats = None
+        self._stats_key = None
+        self._boundary_surface = None
+        self._boundary_key = None
+        self._regions_surface = None
+        self._regions_key = None
+        self._job_id = None
+        self.k_sweep = None       # last automatic k sweep of the current points
+        # step-by-step animation, advanced by step_animation() once per frame
+        self.animation_budget_ms = ANIMATION["frame_budget_ms"]
+        self.animation_interval_ms = ANIMATION["step_interval_ms"]
+        self.animation_status = ""
+        self._animation = None
+        self._animation_job = None
+        self._animation_next = 0.0
+
+    def _invalidate_clusters(self) -> None:
+        """Drop the clustering result after the point set changed."""
+        self.cancel_kmeans()
+        if hasattr(self, "_labels"):
+            del self._labels
+        if hasattr(self, "centroids"):
+            del self.centroids
+        self.k_sweep = None
 
     def add_point(self, pos: tuple[int, int], color: tuple[int, int, int] = COLOR["black"]) -> None:
         """Add point with color if it's inside the canvas."""
         if self._rect.collidepoint(pos):
-            self.points.append((pos[0], pos[1], color))
-            if hasattr(self, "_labels"):
-                del self._labels
-            if hasattr(self, "centroids"):
-                del self.centroids
+            self.cancel_animation()
+            self.version += 1
+            self._edited += 1
+            if self.live and self._online is not None:
+                self._add_point_live(pos)
+                return
+            self.points.append(pos[0], pos[1], self.points.color_id(color))
+            self._invalidate_clusters()
+            if self.live:
+                self._live_refit()
+
+    def _add_point_live(self, pos: tuple[int, int]) -> None:
+        """Assign a new point to its nearest centroid and nudge that centroid, in O(k)."""
+        label = self._online.partial_fit_point(pos[0], pos[1])
+        self.points.append(pos[0], pos[1], self._cluster_color_ids[label % len(self._cluster_color_ids)], label)
+        self.centroids = self._online.centroids
+        self._labels = self.points.labels
+        self._live_added += 1
+        if self._live_added >= self.live_refit_every:
+            self._live_refit()
+
+    def set_live(self, enabled: bool, k: int = 3) -> None:
+        """Toggle live mode, clustering into k groups."""
+        self.live = enabled
+        self.live_k = k
+        self._online = None
+        if enabled:
+            self._live_refit()
+
+    def _live_refit(self) -> None:
+        """Full warm-started refit that corrects the drift of the online updates."""
+        self._live_added = 0
+        if self._online is not None:
+            self._warm_centroids = self._online.centroids.copy()
+            self._warm_weights = self._online.counts.copy()
+        self.run_kmeans_async(self.live_k)
 
     def change_point_color(self, index: int, color: tuple[int, int, int]) -> None:
         """Change color of point at given index."""
         if 0 <= index < len(self.points):
-            x, y, _ = self.points[index]
-            self.points[index] = (x, y, color)
+            self.points.set_color(index, self.points.color_id(color))
+
+    def _points_removed(self, count: int = 1) -> None:
+        self.cancel_animation()
+        self.version += 1
+        self._edited += count
+        self._edit_version += 1
+        if self.live and self._online is not None:
+            # the label column was compacted with the points, so the coloring stays valid
+            self._labels = self.points.labels
+            self._live_refit()
+            return
+        self._invalidate_clusters()
+        if self.live:
+            self._live_refit()
 
     def remove_last_point(self):
-        if self.points:
-            self.points.pop()
-            if hasattr(self, "_labels"):
-                del self._labels
-            if hasattr(self, "centroids"):
-                del self.centroids
+        if self.points.pop() is not None:
+            self._points_removed()
 
     def remove_point_near(self, pos: tuple[int, int], radius: int = 10):
-        old_len = len(self.points)
-        self.points = [
-            (x, y, c) for (x, y, c) in self.points
-            if (x - pos[0])**2 + (y - pos[1])**2 > radius**2
-        ]
-        if len(self.points) != old_len:
-            if hasattr(self, "_labels"):
-                del self._labels
-            if hasattr(self, "centroids"):
-                del self.centroids
+        removed = self.points.remove_near(pos, radius)
+        if removed:
+            self._points_removed(removed)
+
+    def _forget_warm_start(self) -> None:
+        """Drop the centroids kept around for warm-starting the next fit."""
+        if hasattr(self, "_warm_centroids"):
+            del self._warm_centroids
+        if hasattr(self, "_warm_weights"):
+            del self._warm_weights
 
     def clear_points(self) -> None:
         """Remove all points from canvas."""
+        self.cancel_animation()
         self.points.clear()
-        if hasattr(self, "_labels"):
-            del self._labels
-        if hasattr(self, "centroids"):
-            del self.centroids
+        self.version += 1
+        self._edit_version += 1
+        self._invalidate_clusters()
+        self._forget_warm_start()
+        self._edited = 0
+        self._online = None
 
     def clear_canvas(self) -> None:
         """Remove all points and centroids from canvas."""
-        self.points.clear()
-        if hasattr(self, "_labels"):
-            del self._labels
-        if hasattr(self, "centroids"):
-            del self.centroids
+        self.clear_points()
+
+    def load_points(self, xy, labels=None, centroids=None, fit_to_canvas: bool = True) -> None:
+        """
+        Replace the points, e.g. with the sample of a streamed fit, and show its clustering
+        when labels and centroids are given. Points that do not fit the canvas are scaled into it
+        (uniformly, together with the centroids, so the nearest-centroid labels stay valid).
+        """
+        self.clear_points()
+        xy = np.asarray(xy, dtype=np.float64)[:, :2]
+        if centroids is not None:
+            centroids = np.asarray(centroids, dtype=np.float64)[:, :2]
+        if fit_to_canvas and len(xy):
+            lo, hi = xy.min(axis=0), xy.max(axis=0)
+            area = np.array(self._rect.topleft), np.array(self._rect.bottomright) - 1
+            if (lo < area[0]).any() or (hi > area[1]).any():
+                margin = 10
+                scale = ((area[1] - area[0] - 2 * margin) / np.maximum(hi - lo, 1e-12)).min()
+                shift = area[0] + margin - lo * scale
+                xy = xy * scale + shift
+                if centroids is not None:
+                    centroids = centroids * scale + shift
+        self.points.extend(xy)
+        self.version += 1
+        if labels is None or centroids is None:
+            return
+        labels = np.asarray(labels)
+        color_ids = self.points.color_ids(self.cluster_colors)
+        self.points.set_labels(labels)
+        self.points.set_colors(color_ids[labels % len(color_ids)])
+        self.set_clusters(centroids)
+
+    def set_clusters(self, centroids) -> None:
+        """Adopt centroids for the labels already stored with the points, as if a fit produced them."""
+        self._cluster_color_ids = self.points.color_ids(self.cluster_colors)
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        self._labels = self.points.labels
+        self._result_version += 1
+        self._edited = 0
+        self._warm_centroids = self.centroids
+        self._warm_weights = np.bincount(self._labels[self._labels >= 0], minlength=len(self.centroids))
 
     def get_point_near(self, pos: tuple[int, int], radius: int = 10) -> int | None:
         """Get the index of a point near the given position."""
-        for i, (x, y, _) in enumerate(self.points):
-            if (x - pos[0])**2 + (y - pos[1])**2 < radius**2:
-                return i
-        return None
+        hits = self.points.near(pos, radius)
+        return int(hits[0]) if len(hits) else None
+
+    def _draw_key(self) -> tuple:
+        """Everything the canvas image depends on; the canvas is dirty when this changes."""
+        centroids = np.asarray(self.centroids).tobytes() if hasattr(self, "centroids") else None
+        return (self.color, len(self.points), self.points.revision, self.hovered_point_index,
+                self._result_version, centroids, self.boundary_mode)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty or self._draw_key() != self._drawn_key
+
+    def mark_clean(self) -> None:
+        super().mark_clean()
+        self._drawn_key = self._draw_key()
 
     def draw(self, screen: pygame.Surface) -> None:
+        profiler = self.profiler
+        # whatever the renderer did before the canvas, then the canvas and its boundary separately
+        profiler.lap("render")
+        # clipped so rings and the tooltip cannot spill outside the canvas rectangle
+        clip = screen.get_clip()
+        screen.set_clip(self._rect)
         pygame.draw.rect(screen, self.color, self._rect)
-        for i, (x, y, color) in enumerate(self.points):
-            point_color = self.point_hover_color if i == self.hovered_point_index else color
-            pygame.draw.circle(screen, point_color, (x, y), 5)
+        # level of detail: individual circles for small sets, a density image for large ones
+        layer = self.density_layer if len(self.points) >= self.density_threshold else self.point_layer
+        screen.blit(layer.render(self.points, self._rect.topleft), self._rect.topleft)
+        if self.hovered_point_index is not None:
+            x, y, _ = self.points[self.hovered_point_index]
+            pygame.draw.circle(screen, self.point_hover_color, (x, y), 5)
         if hasattr(self, "centroids"):
             for cx, cy in self.centroids:
                 pygame.draw.circle(screen, COLOR["black"], (int(cx), int(cy)), 10, 2)
+        profiler.lap("canvas.draw")
+        if self.boundary_mode is not None:
+            self.draw_clusters_boundary(screen, self.boundary_mode)
+            profiler.lap("boundary")
 
         if self.hovered_point_index is not None:
             x, y, _ = self.points[self.hovered_point_index]
-            font = pygame.font.Font(None, 24)
-            text_surface = font.render(f"({x}, {y})", True, COLOR["black"])
+            text_surface = render_text(get_font(None, 24), f"({int(x)}, {int(y)})", COLOR["black"])
             screen.blit(text_surface, (x + 10, y + 10))
+        screen.set_clip(clip)
+        profiler.lap("canvas.draw")
+
+    def cluster_stats(self) -> ClusterStats | None:
+        """Per-cluster sizes, inertia, radius and bounding boxes, computed once per result."""
+        if not hasattr(self, "centroids") or not hasattr(self, "_labels"):
+            return None
+        key = (self.version, self._result_version)
+        if self._stats_key != key:
+            if len(self._labels) != len(self.points):
+                return None
+            self._stats = cluster_stats(self.points.xy, self._labels, len(self.centroids), self.centroids)
+            self._stats_key = key
+        return self._stats
 
-    def draw_clusters_boundary(self, screen: pygame.Surface):
-        """Draw convex hull boundary for each cluster if kmeans has been run."""
-        if not hasattr(self, "centroids") or not hasattr(self, "points") or not self.points:
+    def cluster_hulls(self) -> list[np.ndarray] | None:
+        """Convex hull of each cluster, recomputed only when the points or labels change."""
+        if not hasattr(self, "centroids") or not hasattr(self, "_labels") or not self.points:
+            return None
+        key = (self.version, self._result_version)
+        if self._hulls_key != key:
+            data = self.points.xy
+            labels = self._labels
+            if len(data) != len(labels):
+                return None
+            # one sort groups every cluster instead of a mask per cluster
+            order = np.argsort(labels, kind="stable")
+            counts = np.bincount(labels[labels >= 0], minlength=len(self.centroids))
+            start = np.searchsorted(labels[order], 0)
+            hulls = []
+            for count in counts:
+                members = data[order[start:start + count]]
+                start += count
+                if count >= 3:
+                    hull = convex_hull(members)
+                    if len(hull) >= 3:
+                        hulls.append(hull)
+            self._hulls = hulls
+            self._hulls_key = key
+        return self._hulls
+
+    def draw_clusters_boundary(self, screen: pygame.Surface, mode: str = "hull"):
+        """Draw cluster boundaries if kmeans has been run: convex hulls, or nearest-centroid "regions"."""
+        if mode == "regions":
+            self._draw_regions(screen)
             return
-        try:
-            import numpy as np
-            from scipy.spatial import ConvexHull
-        except ImportError:
+        hulls = self.cluster_hulls()
+        if not hulls:
             return
+        # the outlines are rendered once per result and blitted as a single surface
+        if self._boundary_key != self._hulls_key:
+            surface = pygame.Surface(self.size, pygame.SRCALPHA)
+            offset = np.array(self._rect.topleft)
+            for hull in hulls:
+                pygame.draw.polygon(surface, COLOR["black"], (hull - offset).tolist(), 2)
+            self._boundary_surface = surface
+            self._boundary_key = self._hulls_key
+        screen.blit(self._boundary_surface, self._rect.topleft)
+
+    # ======= Decision regions =======
+    REGION_ALPHA = 70
+    REGION_BLOCK = 8
+
+    def _draw_regions(self, screen: pygame.Surface) -> None:
+        """Tint every canvas pixel with the color of its nearest centroid; rebuilt only when centroids move."""
+        if not hasattr(self, "centroids") or len(self.centroids) == 0:
+            return
+        key = (np.asarray(self.centroids).tobytes(), tuple(self.cluster_colors))
+        if self._regions_key != key:
+            grid = nearest_centroid_grid(self.size, self.centroids, self._rect.topleft, self.REGION_BLOCK)
+            palette = np.array(self.cluster_colors, dtype=np.uint8)
+            surface = pygame.Surface(self.size)
+            pygame.surfarray.blit_array(surface, palette[grid % len(palette)])
+            surface.set_alpha(self.REGION_ALPHA)
+            self._regions_surface = surface
+            self._regions_key = key
+        screen.blit(self._regions_surface, self._rect.topleft)
+
+    def _warm_start_pays(self, k: int) -> bool:
+        """
+        Warm starts are for live refits, k changes and small edits. Run on unchanged points, or
+        after edits beyond warm_start_max_edits of them, does a full cold fit with restarts instead.
+        """
+        init = getattr(self, "_warm_centroids", None)
+        if self.live or init is None:
+            return self.live
+        if self._edited == 0:
+            return len(init) != k
+        return self._edited <= KMEANS["warm_start_max_edits"] * len(self.points)
 
-        if not hasattr(self, "_labels"):
+    def _kmeans_job(self, k: int, warm_start=None) -> dict | None:
+        """Describe a fit of the current points; None if there are too few of them."""
+        if len(self.points) < k:
+            return None
+        warm = self.warm_start and self._warm_start_pays(k) if warm_start is None else warm_start
+        return {
+            "k": k,
+            "backend": self.kmeans_backend,
+            "algorithm": self.kmeans_algorithm,
+            "init": getattr(self, "_warm_centroids", None) if warm else None,
+            "weights": getattr(self, "_warm_weights", None) if warm else None,
+            "n": len(self.points),
+            "version": self.version,
+            "edit_version": self._edit_version,
+            "live": self.live,
+        }
+
+    @staticmethod
+    def _fit_job(data, job, should_stop=None):
+        return KMeans(n_clusters=job["k"], backend=job["backend"], algorithm=job["algorithm"]).fit(
+            data, job["init"], job["weights"], should_stop)
+
+    def run_kmeans(self, k=3, colors=None, warm_start=None):
+        """
+        Cluster the points into k groups and color them.
+        With warm start the fit is seeded from the previous centroids (kept across
+        point edits), so small changes converge in a few iterations; by default it is used
+        only where it pays off, see _warm_start_pays.
+        """
+        job = self._kmeans_job(k, warm_start)
+        if job is None:
             return
+        self.cancel_kmeans()
+        self.cancel_animation()
+        self.apply_kmeans(self._fit_job(self.points.xy, job), job, colors)
 
-        data = np.array([[x, y] for x, y, _ in self.points])
-        labels = self._labels
-        if len(data) != len(labels):
+    def run_kmeans_async(self, k=3, warm_start=None) -> None:
+        """Submit a fit to the background worker, or run it inline when there is none."""
+        if self.worker is None:
+            self.run_kmeans(k, warm_start=warm_start)
+            return
+        job = self._kmeans_job(k, warm_start)
+        if job is None:
             return
+        # a running animation would overwrite this fit with its own last step
+        self.cancel_animation()
+        # the worker gets its own copy so edits made meanwhile cannot race with it
+        self._job_id = self.worker.submit(self._fit_job, self.points.xy.copy(), job, payload=job)
 
-        k = len(self.centroids)
-        for cluster_idx in range(k):
-            cluster_points = data[labels == cluster_idx]
-            if len(cluster_points) >= 3:
-                hull = ConvexHull(cluster_points)
-                hull_points = cluster_points[hull.vertices]
-                pygame.draw.polygon(screen, (0, 0, 0), hull_points, 2)
-
-    def run_kmeans(self, k=3, colors=None):
-        import numpy as np
-        from sklearn.cluster import KMeans
+    @staticmethod
+    def _sweep_job(data, job, should_stop=None) -> KSweep:
+        return sweep_k(data, job["k_max"], algorithm=job["algorithm"], backend=job["backend"],
+                       should_stop=should_stop)
+
+    def _auto_k_job(self, k_max: int) -> dict | None:
+        job = self._kmeans_job(1, warm_start=False)
+        if job is not None:
+            job["k_max"] = k_max
+            job["sweep"] = True
+        return job
+
+    def run_auto_k(self, k_max: int = AUTO_K["k_max"]) -> None:
+        """Fit k = 1..k_max, keep the sweep in k_sweep and show the fit of the k it chose."""
+        job = self._auto_k_job(k_max)
+        if job is None:
+            return
+        self.cancel_kmeans()
+        self.apply_kmeans(self._sweep_job(self.points.xy, job), job)
+
+    def run_auto_k_async(self, k_max: int = AUTO_K["k_max"]) -> None:
+        """run_auto_k on the background worker, or inline when there is none."""
+        if self.worker is None:
+            self.run_auto_k(k_max)
+            return
+        job = self._auto_k_job(k_max)
+        if job is None:
+            return
+        self._job_id = self.worker.submit(self._sweep_job, self.points.xy.copy(), job, payload=job)
+
+    @property
+    def kmeans_running(self) -> bool:
+        return self._job_id is not None
+
+    def cancel_kmeans(self) -> None:
+        if self._job_id is not None:
+            self.worker.cancel()
+            self._job_id = None
+
+    def handle_kmeans_event(self, event) -> bool:
+        """Apply a finished background fit. Returns True if the canvas changed."""
+        if self.worker is None or event.job_id != self._job_id:
+            return False
+        self._job_id = None
+        if event.error is not None:
+            show_msg(LEVEL["ERROR"], f"K-means failed: {event.error}")
+            return False
+        return self.apply_kmeans(event.result, event.payload)
+
+    def apply_kmeans(self, result, job, colors=None) -> bool:
+        """Store a fit result and color the points. Stale results are ignored."""
+        n = job["n"]
+        if job["live"]:
+            # live fits tolerate points appended meanwhile, they are relabeled below
+            if job["edit_version"] != self._edit_version or len(self.points) < n:
+                return False
+        elif job["version"] != self.version:
+            return False
+        if isinstance(result, KSweep):
+            # a sweep is shown as the fit of the k it chose
+            self.k_sweep = result
+            job = {**job, "k": result.best_k}
+            result = result.best
+        k = job["k"]
         if colors is None:
-            base_colors = [
-                COLOR["red"],
-                COLOR["lime"],
-                COLOR["blue"],
-                COLOR["cyan"],
-                COLOR["magenta"],
-                COLOR["orange"],
-                COLOR["green_yellow"],
-                COLOR["deep_pink"],
-                COLOR["steel_blue"],
-                COLOR["brown"],
-            ]
-            colors = base_colors[:10]
-        if len(self.points) < k:
+            colors = self.cluster_colors
+        color_ids = self.points.color_ids(colors)
+        self._cluster_color_ids = color_ids
+        labels = self.points.labels
+        labels[:n] = result.labels
+        if len(self.points) > n:
+            labels[n:], _ = assign_labels(self.points.xy[n:], result.centroids)
+        self.points.set_colors(color_ids[labels % len(color_ids)])
+        self.centroids = result.centroids
+        self._labels = labels
+        self._result_version += 1
+        self.last_result = result
+        self._edited = 0
+        self._warm_centroids = result.centroids
+        self._warm_weights = np.bincount(labels, minlength=k)
+        if self.live:
+            self.live_k = k
+            self._online = OnlineKMeans(result.centroids, self._warm_weights)
+        return True
+
+    # ======= Step-by-step animation =======
+    SEED_SAMPLE_SIZE = 20000
+
+    @property
+    def animating(self) -> bool:
+        return self._animation is not None
+
+    def start_kmeans_animation(self, k=3, warm_start=None) -> None:
+        """Start a Lloyd run that step_animation() plays back one assign/update step at a time."""
+        job = self._kmeans_job(k, warm_start)
+        if job is None:
             return
+        self.cancel_kmeans()
+        self.cancel_animation()
+        data = self.points.xy
+        rng = np.random.default_rng(KMEANS["seed"])
+        if job["init"] is not None:
+            init = resize_centroids(data, job["init"], k, rng, job["weights"])
+        else:
+            # seed on a sample so starting the animation never stalls a frame
+            sample = data
+            if len(data) > self.SEED_SAMPLE_SIZE:
+                sample = data[rng.integers(len(data), size=self.SEED_SAMPLE_SIZE)]
+            init = kmeans_plusplus(sample, k, rng)
+        self._animation = lloyd_steps(data, init)
+        self._animation_job = job
+        self._animation_next = 0.0
+
+    def cancel_animation(self) -> None:
+        if self._animation is not None:
+            self._animation.close()
+            self._animation = None
+            self._animation_job = None
+            self.animation_status = ""
+
+    def step_animation(self, budget_ms=None) -> bool:
+        """
+        Advance the animation within a time budget. Returns True when a visible step
+        (new centroids or new colors) was applied. Safe to call every frame.
+        """
+        if self._animation is None:
+            return False
+        now = time.perf_counter()
+        if now < self._animation_next:
+            return False
+        budget = (self.animation_budget_ms if budget_ms is None else budget_ms) / 1000
+        deadline = now + budget
+        while True:
+            try:
+                phase, n_iter, labels, centroids, inertia = next(self._animation)
+            except StopIteration:
+                self.cancel_animation()
+                return False
+            if phase != "partial":
+                break
+            if time.perf_counter() >= deadline:
+                return False
 
-        data = np.array([[x, y] for x, y, _ in self.points])
-        kmeans = KMeans(n_clusters=k, n_init=10)
-        labels = kmeans.fit_predict(data)
-        for i, label in enumerate(labels):
-            self.change_point_color(i, colors[label % len(colors)])
-        self.centroids = kmeans.cluster_centers_
-        self._labels = np.array(labels)
+        self._animation_next = time.perf_counter() + self.animation_interval_ms / 1000
+        self.animation_status = f"Iteration {n_iter}: {phase}"
+        if phase == "done":
+            job = self._animation_job
+            self._animation = None
+            self._animation_job = None
+            self.animation_status = ""
+            return self.apply_kmeans(KMeansResult(centroids, labels.copy(), inertia, n_iter), job)
+        if phase == "assign":
+            color_ids = self.points.color_ids(self.cluster_colors)
+            self.points.set_labels(labels)
+            self.points.set_colors(color_ids[labels % len(color_ids)])
+            self._labels = self.points.labels
+        self.centroids = centroids
+        self._result_version += 1
+        return True
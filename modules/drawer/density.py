@@ -0,0 +1,91 @@
+from ..pointstore import PointStore
+import numpy as np
+import pygame
+
+class DensityLayer:
+    """
+    Level-of-detail stand-in for PointLayer on very large point sets. Points are binned per
+    pixel and per palette color; each occupied pixel shows its majority color, more opaque
+    where more points fall. Appended points are added to the bins incrementally, any other
+    change of the store rebuilds them with a single bincount.
+    """
+    MIN_ALPHA = 90
+
+    def __init__(self, size: tuple[int, int]):
+        self.size = size
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._counts = np.zeros((size[0] * size[1], 0), dtype=np.uint32)
+        self._revision = None
+        self._count = 0
+        self._max = 0
+
+    def _accumulate(self, store: PointStore, start: int, offset: tuple[int, int]) -> np.ndarray:
+        """Bin the points from start on; returns the flat indices of the pixels they fall in."""
+        w, h = self.size
+        xy = store.xy[start:]
+        px = np.floor(xy[:, 0] - offset[0]).astype(np.int64)
+        py = np.floor(xy[:, 1] - offset[1]).astype(np.int64)
+        inside = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        # x-major pixel index, the layout surfarray uses
+        pixels = (px * h + py)[inside]
+        colors = store.colors[start:][inside].astype(np.int64)
+        n_colors = len(store.palette)
+        if self._counts.shape[1] < n_colors:
+            grown = np.zeros((w * h, n_colors), dtype=np.uint32)
+            grown[:, :self._counts.shape[1]] = self._counts
+            self._counts = grown
+        if len(pixels) < w * h:
+            np.add.at(self._counts, (pixels, colors), 1)
+        else:
+            keys = np.bincount(pixels * n_colors + colors, minlength=w * h * n_colors)
+            self._counts += keys.reshape(w * h, n_colors).astype(np.uint32)
+        return pixels
+
+    def _paint(self, palette: list[tuple[int, int, int]], pixels: np.ndarray | None = None) -> None:
+        """Recolor the given flat pixel indices, or the whole image when the peak density changed."""
+        w, h = self.size
+        counts = self._counts
+        if pixels is not None:
+            pixels = np.unique(pixels)
+            counts = counts[pixels]
+        totals = counts.sum(axis=1)
+        peak = int(totals.max()) if len(totals) else 0
+        if pixels is not None and peak > self._max:
+            # a new peak rescales every pixel's opacity
+            return self._paint(palette)
+        if pixels is None:
+            self._max = peak
+        rgb = np.array(palette, dtype=np.uint8).reshape(-1, 3)[counts.argmax(axis=1)]
+        alpha = np.zeros(len(totals), dtype=np.uint8)
+        occupied = totals > 0
+        if occupied.any():
+            # log scale, so a handful of points is still visible next to dense cores
+            level = np.log1p(totals[occupied]) / np.log1p(self._max)
+            alpha[occupied] = self.MIN_ALPHA + (255 - self.MIN_ALPHA) * level
+        if pixels is None:
+            index = (slice(None), slice(None))
+            rgb, alpha = rgb.reshape(w, h, 3), alpha.reshape(w, h)
+        else:
+            index = np.divmod(pixels, h)
+        surface_rgb = pygame.surfarray.pixels3d(self.surface)
+        surface_rgb[index] = rgb
+        del surface_rgb
+        surface_alpha = pygame.surfarray.pixels_alpha(self.surface)
+        surface_alpha[index] = alpha
+        del surface_alpha
+
+    def render(self, store: PointStore, offset: tuple[int, int] = (0, 0)) -> pygame.Surface:
+        """Bring the layer up to date with the store and return it."""
+        n = len(store)
+        if store.revision != self._revision:
+            self._counts[:] = 0
+            self._revision = store.revision
+            self._count = 0
+            self._accumulate(store, 0, offset)
+            self._count = n
+            self._paint(store.palette)
+        elif n > self._count:
+            touched = self._accumulate(store, self._count, offset)
+            self._count = n
+            self._paint(store.palette, touched)
+        return self.surface
@@ -0,0 +1,34 @@
+from ..constants import TEXT_CACHE_SIZE
+from collections import OrderedDict
+import pygame
+
+# Process-wide caches: SysFont lookups and text rendering are slow enough to show up per frame.
+_fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+_surfaces: OrderedDict = OrderedDict()
+
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """Shared font for (name, size); None is pygame's default font."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+def render_text(font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+    """Antialiased text surface, served from a bounded LRU cache. Callers must not draw on it."""
+    key = (font, text, tuple(color))
+    surface = _surfaces.get(key)
+    if surface is not None:
+        _surfaces.move_to_end(key)
+        return surface
+    surface = font.render(text, True, color)
+    _surfaces[key] = surface
+    if len(_surfaces) > TEXT_CACHE_SIZE:
+        _surfaces.popitem(last=False)
+    return surface
+
+def clear_caches() -> None:
+    """Drop every cached font and surface, e.g. before pygame.font.quit()."""
+    _fonts.clear()
+    _surfaces.clear()
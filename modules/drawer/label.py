@@ -1,10 +1,11 @@
 from .base import UIElement, COLOR
+from .fonts import get_font, render_text
 import pygame
 
 class Label(UIElement):
     def __init__(self, text, font_size, position, color=COLOR["black"]):
         super().__init__(position, color)
-        self._font = pygame.font.SysFont("Arial", font_size)
+        self._font = get_font("Arial", font_size)
         self._text = text
         self._rect = pygame.Rect(position[0], position[1], 0, 0)
         self._render()
@@ -15,14 +16,22 @@ class Label(UIElement):
 
     @text.setter
     def text(self, value):
+        if value == self._text:
+            return
         self._text = value
         self._render()
 
+    def set_color(self, color):
+        if color != self.color:
+            self.color = self._original_color = color
+            self._render()
+
     def _render(self):
         lines = self.text.split('\n')
-        self.rendered_lines = [self._font.render(line, True, self.color) for line in lines]
+        self.rendered_lines = [render_text(self._font, line, self.color) for line in lines]
         self._rect.width = max(r.get_width() for r in self.rendered_lines)
         self._rect.height = sum(r.get_height() for r in self.rendered_lines)
+        self._dirty = True
 
     def draw(self, screen):
         y = self._rect.top
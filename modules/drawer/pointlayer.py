@@ -0,0 +1,48 @@
+from ..pointstore import PointStore
+import numpy as np
+import pygame
+
+class PointLayer:
+    """
+    Transparent surface holding every point of a PointStore, drawn with one pre-rendered
+    sprite per palette color and Surface.blits. It is re-rendered only when the store
+    changes, and appended points are stamped onto it incrementally.
+    """
+    def __init__(self, size: tuple[int, int], radius: int = 5):
+        self.size = size
+        self.radius = radius
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._sprites: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._revision = None
+        self._count = 0
+
+    def sprite(self, color: tuple[int, int, int]) -> pygame.Surface:
+        """Filled circle of the given color, rendered once."""
+        sprite = self._sprites.get(color)
+        if sprite is None:
+            r = self.radius
+            sprite = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (r, r), r)
+            self._sprites[color] = sprite
+        return sprite
+
+    def _stamp(self, store: PointStore, start: int, offset: tuple[int, int]) -> None:
+        xy = store.xy[start:]
+        if len(xy) == 0:
+            return
+        corners = (np.floor(xy) - (np.array(offset) + self.radius)).astype(np.int32).tolist()
+        sprites = [self.sprite(color) for color in store.palette]
+        self.surface.blits(list(zip(map(sprites.__getitem__, store.colors[start:].tolist()), corners)),
+                           doreturn=False)
+
+    def render(self, store: PointStore, offset: tuple[int, int] = (0, 0)) -> pygame.Surface:
+        """Bring the layer up to date with the store and return it."""
+        n = len(store)
+        if store.revision != self._revision:
+            self.surface.fill((0, 0, 0, 0))
+            self._revision = store.revision
+            self._count = 0
+        if n > self._count:
+            self._stamp(store, self._count, offset)
+            self._count = n
+        return self.surface
@@ -0,0 +1,60 @@
+from .base import UIElement, COLOR
+from ..constants import PROFILER
+from ..profiler import FrameProfiler
+from .fonts import get_font
+import pygame
+import time
+
+class ProfilerOverlay(UIElement):
+    """
+    HUD with the frame rate and p50/p95/max per profiler phase, anchored at its bottom-right
+    corner. The numbers are recomputed every refresh_ms, not every frame.
+    """
+    BACKGROUND = (0, 0, 0, 180)
+    COLUMNS = ("p50", "p95", "max")
+    PADDING = 6
+
+    def __init__(self, profiler: FrameProfiler, bottomright: tuple[int, int], font_size: int = 18,
+                 refresh_ms: int = PROFILER["hud_refresh_ms"]):
+        super().__init__(bottomright, COLOR["white"])
+        self.profiler = profiler
+        self.bottomright = bottomright
+        self.refresh = refresh_ms / 1000
+        self._font = get_font(None, font_size)
+        self._surface = None
+        self._next = 0.0
+        self._rect = pygame.Rect(bottomright, (0, 0))
+
+    def update(self, mouse_pos=None) -> None:
+        now = time.perf_counter()
+        if now >= self._next:
+            self._next = now + self.refresh
+            self._render()
+
+    def _render(self) -> None:
+        # numbers change on every refresh, so they bypass the shared text cache
+        render = lambda text: self._font.render(text, True, self.color)
+        rows = [[render(f"{self.profiler.fps:.1f} FPS"), *(render(c) for c in self.COLUMNS)]]
+        for name, stats in self.profiler.summary().items():
+            rows.append([render(name), *(render(f"{stats[c]:.2f}") for c in self.COLUMNS)])
+        pad = self.PADDING
+        name_width = max(row[0].get_width() for row in rows) + 2 * pad
+        cell_width = max(cell.get_width() for row in rows for cell in row[1:]) + 2 * pad
+        line = self._font.get_linesize()
+        surface = pygame.Surface((name_width + cell_width * len(self.COLUMNS) + pad, line * len(rows) + 2 * pad),
+                                 pygame.SRCALPHA)
+        surface.fill(self.BACKGROUND)
+        for i, row in enumerate(rows):
+            y = pad + i * line
+            surface.blit(row[0], (pad, y))
+            for j, cell in enumerate(row[1:]):
+                # numbers are right-aligned in their column
+                surface.blit(cell, (name_width + (j + 1) * cell_width - cell.get_width(), y))
+        self._surface = surface
+        self._rect = surface.get_rect(bottomright=self.bottomright)
+        self._dirty = True
+
+    def draw(self, screen) -> None:
+        if self._surface is None:
+            self._render()
+        screen.blit(self._surface, self._rect)
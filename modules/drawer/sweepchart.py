@@ -0,0 +1,77 @@
+from .base import UIElement, COLOR
+from ..kmeans import KSweep
+from .fonts import get_font, render_text
+import numpy as np
+import pygame
+
+class SweepChart(UIElement):
+    """
+    Elbow and silhouette curves of an automatic k sweep, with the chosen k marked. Inertia is
+    drawn relative to k = 1, the silhouette on its 0..1 scale; both share one y axis.
+    """
+    BACKGROUND = (255, 255, 255, 220)
+    INERTIA_COLOR = COLOR["steel_blue"]
+    SILHOUETTE_COLOR = COLOR["dark_orange"]
+    MARGIN = (26, 8, 8, 30)  # left, top, right, bottom
+
+    def __init__(self, position, size, color=COLOR["black"]):
+        super().__init__(position, color)
+        self._rect = pygame.Rect(position, size)
+        self._font = get_font(None, 18)
+        self._sweep = None
+        self._surface = None
+
+    @property
+    def sweep(self) -> KSweep | None:
+        return self._sweep
+
+    @sweep.setter
+    def sweep(self, value: KSweep | None) -> None:
+        if value is self._sweep:
+            return
+        self._sweep = value
+        if value is not None:
+            self._render()
+        self._dirty = True
+
+    def _render(self) -> None:
+        sweep = self._sweep
+        surface = pygame.Surface(self._rect.size, pygame.SRCALPHA)
+        surface.fill(self.BACKGROUND)
+        pygame.draw.rect(surface, self.color, surface.get_rect(), 1)
+        left, top, right, bottom = self.MARGIN
+        plot = pygame.Rect(left, top, self._rect.width - left - right, self._rect.height - top - bottom)
+        pygame.draw.lines(surface, self.color, False, [plot.topleft, plot.bottomleft, plot.bottomright])
+
+        ks = sweep.ks
+        span = max(len(ks) - 1, 1)
+        xs = plot.left + (ks - ks[0]) / span * plot.width
+        to_y = lambda values: plot.bottom - np.clip(values, 0, 1) * plot.height
+        inertia = sweep.inertia / sweep.inertia[0] if sweep.inertia[0] > 0 else np.zeros(len(ks))
+        best_x = xs[sweep.best_k - ks[0]]
+        pygame.draw.line(surface, COLOR["gray"], (best_x, plot.top), (best_x, plot.bottom))
+        if len(ks) > 1:
+            pygame.draw.lines(surface, self.INERTIA_COLOR, False, list(zip(xs, to_y(inertia))), 2)
+        valid = np.isfinite(sweep.silhouette)
+        if valid.sum() > 1:
+            pygame.draw.lines(surface, self.SILHOUETTE_COLOR, False,
+                              list(zip(xs[valid], to_y(sweep.silhouette[valid]))), 2)
+
+        for k, x in zip(ks, xs):
+            text = render_text(self._font, str(k), self.color)
+            surface.blit(text, (x - text.get_width() / 2, plot.bottom + 2))
+        for text, y in (("1", plot.top), ("0", plot.bottom)):
+            label = render_text(self._font, text, self.color)
+            surface.blit(label, (left - label.get_width() - 4, y - label.get_height() / 2))
+        legend = [render_text(self._font, "inertia", self.INERTIA_COLOR),
+                  render_text(self._font, "silhouette", self.SILHOUETTE_COLOR),
+                  render_text(self._font, f"best k = {sweep.best_k}", self.color)]
+        x = left
+        for text in legend:
+            surface.blit(text, (x, self._rect.height - text.get_height() - 2))
+            x += text.get_width() + 10
+        self._surface = surface
+
+    def draw(self, screen) -> None:
+        if self._sweep is not None:
+            screen.blit(self._surface, self._rect)
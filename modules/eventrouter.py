@@ -0,0 +1,67 @@
+from .uielement import UIElement, focus_manager
+import pygame
+
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+class EventRouter:
+    """
+    Delivers mouse events only to the registered elements that care: the one under the
+    cursor, the one the cursor just left and the focused one. Elements are hit-tested in
+    reverse registration order, so register the topmost last. The cursor position comes from
+    the events themselves instead of pygame.mouse.get_pos().
+    """
+    def __init__(self):
+        self._handlers: dict[UIElement, callable] = {}
+        self._order: list[UIElement] = []
+        self._hovered = None
+        self.mouse_pos = (-1, -1)
+
+    def register(self, element: UIElement, handler=None) -> None:
+        """handler(event, mouse_pos) receives the element's events; element.execute by default."""
+        if element not in self._handlers:
+            self._order.append(element)
+        self._handlers[element] = handler or element.execute
+
+    def unregister(self, element: UIElement) -> None:
+        if self._handlers.pop(element, None) is not None:
+            self._order.remove(element)
+            if self._hovered is element:
+                self._hovered = None
+
+    def hit(self, pos: tuple[int, int]) -> UIElement | None:
+        for element in reversed(self._order):
+            if element.rect.collidepoint(pos):
+                return element
+        return None
+
+    @staticmethod
+    def coalesce(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+        """Keep only the last MOUSEMOTION of a frame; clicks carry their own position."""
+        last = None
+        for i, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last = i
+        if last is None:
+            return events
+        return [event for i, event in enumerate(events) if event.type != pygame.MOUSEMOTION or i == last]
+
+    def dispatch(self, event: pygame.event.Event) -> bool:
+        """Route a mouse event. Returns False for events that are not for the UI elements."""
+        if event.type == pygame.WINDOWLEAVE:
+            # the cursor is gone, so whatever it hovered must un-hover
+            event = pygame.event.Event(pygame.MOUSEMOTION, pos=(-1, -1), rel=(0, 0), buttons=(0, 0, 0))
+        elif event.type == pygame.MOUSEWHEEL:
+            if self._hovered is not None:
+                self._handlers[self._hovered](event, self.mouse_pos)
+            return True
+        elif event.type not in POINTER_EVENTS:
+            return False
+        pos = self.mouse_pos = event.pos
+        target = self.hit(pos)
+        # the element left behind un-hovers, the focused one loses focus on a click elsewhere
+        recipients = [self._hovered, focus_manager.get_focused(), target]
+        self._hovered = target
+        for i, element in enumerate(recipients):
+            if element is not None and element in self._handlers and element not in recipients[:i]:
+                self._handlers[element](event, pos)
+        return True
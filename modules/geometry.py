@@ -0,0 +1,59 @@
+import numpy as np
+
+def _side(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> list:
+    """Hull vertices strictly to the left of a->b, in order from a to b (quickhull step)."""
+    cross = (b[0] - a[0]) * (points[:, 1] - a[1]) - (b[1] - a[1]) * (points[:, 0] - a[0])
+    outside = cross > 0
+    if not outside.any():
+        return []
+    points, cross = points[outside], cross[outside]
+    ties = np.flatnonzero(cross == cross.max())
+    # among equally far points take the one nearest b, so none of them ends up mid-edge
+    along = (points[ties, 0] - a[0]) * (b[0] - a[0]) + (points[ties, 1] - a[1]) * (b[1] - a[1])
+    far = points[ties[along.argmax()]]
+    return _side(points, a, far) + [far] + _side(points, far, b)
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """
+    Convex hull vertices of a 2-D point set, in order, as a float array.
+    Quickhull with every partition step vectorized, so the Python-level work
+    grows with the number of hull vertices rather than with the number of points.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 3:
+        return points
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    a, b = points[order[0]], points[order[-1]]
+    if np.array_equal(a, b):
+        return points[:1]
+    hull = [a] + _side(points, a, b) + [b] + _side(points, b, a)
+    return np.array(hull)
+
+def nearest_centroid_grid(size: tuple[int, int], centroids: np.ndarray, origin: tuple[float, float] = (0, 0),
+                          block: int = 8) -> np.ndarray:
+    """
+    Index of the nearest centroid for every pixel of a (width, height) grid, x-major like surfarray.
+    Labels are first taken at the corners of block x block tiles; Voronoi cells are convex,
+    so a tile whose four corners agree is filled as a whole and only the others are refined per pixel.
+    """
+    from .kmeans import assign_labels
+    width, height = size
+    centroids = np.asarray(centroids, dtype=np.float64)
+    xs = np.minimum(np.arange(0, width + block, block), width - 1)
+    ys = np.minimum(np.arange(0, height + block, block), height - 1)
+    gx, gy = np.meshgrid(xs + origin[0], ys + origin[1], indexing="ij")
+    corners, _ = assign_labels(np.column_stack((gx.ravel(), gy.ravel())), centroids)
+    corners = corners.reshape(len(xs), len(ys))
+    tiles = corners[:-1, :-1]
+    out = np.repeat(np.repeat(tiles, block, axis=0), block, axis=1)[:width, :height]
+    mixed = ((tiles != corners[1:, :-1]) | (tiles != corners[:-1, 1:]) | (tiles != corners[1:, 1:]))
+    bx, by = np.nonzero(mixed)
+    if len(bx):
+        step = np.arange(block)
+        px = (bx[:, None, None] * block + step[None, :, None]).repeat(block, axis=2).ravel()
+        py = (by[:, None, None] * block + step[None, None, :]).repeat(block, axis=1).ravel()
+        inside = (px < width) & (py < height)
+        px, py = px[inside], py[inside]
+        pixels = np.column_stack((px + origin[0], py + origin[1])).astype(np.float64)
+        out[px, py], _ = assign_labels(pixels, centroids)
+    return out
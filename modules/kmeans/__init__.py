@@ -0,0 +1,17 @@
+from .engine import KMeans
+from .result import KMeansResult
+from .lloyd import assign_labels, lloyd, lloyd_steps, FitCancelled
+from .seeding import kmeans_plusplus
+from .warmstart import resize_centroids
+from .online import OnlineKMeans
+from .hamerly import hamerly
+from .stats import ClusterStats, cluster_stats
+from .autok import KSweep, sweep_k
+from .streaming import StreamingKMeans, iter_chunks
+from .refine import ALGORITHMS
+from .backends import BACKENDS
+
+__all__ = ["KMeans", "KMeansResult", "assign_labels", "lloyd", "lloyd_steps", "FitCancelled",
+           "kmeans_plusplus", "resize_centroids", "OnlineKMeans",
+           "hamerly", "ClusterStats", "cluster_stats", "KSweep", "sweep_k", "StreamingKMeans", "iter_chunks",
+           "ALGORITHMS", "BACKENDS"]
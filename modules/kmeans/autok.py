@@ -0,0 +1,118 @@
+from ..constants import KMEANS, AUTO_K
+from .backends import fit_numpy, get_backend
+from .lloyd import assign_labels, check_stop, sq_distances, tolerance
+from .parallel import refine_parallel, resolve_n_jobs
+from .result import KMeansResult
+from .seeding import kmeans_plusplus
+from .warmstart import resize_centroids
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass
+class KSweep:
+    ks: np.ndarray          # (k_max,) 1..k_max
+    inertia: np.ndarray     # (k_max,) of the fit for each k
+    silhouette: np.ndarray  # (k_max,) sampled mean silhouette, nan for k = 1
+    centroids: list         # (k, 2) float64 per k
+    best_k: int
+    best: KMeansResult      # the fit for best_k, with labels for every point
+
+def sampled_silhouettes(distances: np.ndarray, labelings: list, ks) -> np.ndarray:
+    """
+    Mean silhouette of m sample points under each labeling (into the matching k clusters),
+    from their (m, m) distance matrix; nan where the sample falls in fewer than two clusters.
+    Points alone in their cluster score 0.
+    """
+    m = len(distances)
+    rows = np.arange(m)
+    # the summed distance from every point to every cluster of every labeling is one matrix
+    # product, so the (memory-bound) distance matrix is read once instead of once per k
+    offsets = np.concatenate([[0], np.cumsum(ks)])
+    onehot = np.zeros((m, offsets[-1]), dtype=distances.dtype)
+    for labels, offset in zip(labelings, offsets):
+        onehot[rows, offset + labels] = 1
+    all_sums = (distances @ onehot).astype(np.float64)
+    scores = np.full(len(ks), np.nan)
+    for i, (labels, k) in enumerate(zip(labelings, ks)):
+        sums = all_sums[:, offsets[i]:offsets[i + 1]]
+        sizes = np.bincount(labels, minlength=k).astype(np.float64)
+        if np.count_nonzero(sizes) < 2:
+            continue
+        own = sizes[labels]
+        a = sums[rows, labels] / np.maximum(own - 1, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_to = sums / sizes
+        mean_to[:, sizes == 0] = np.inf
+        mean_to[rows, labels] = np.inf
+        b = mean_to.min(axis=1)
+        point_scores = (b - a) / np.maximum(np.maximum(a, b), 1e-12)
+        point_scores[own <= 1] = 0
+        scores[i] = point_scores.mean()
+    return scores
+
+def sampled_silhouette(distances: np.ndarray, labels: np.ndarray, k: int) -> float:
+    """sampled_silhouettes for a single labeling."""
+    return float(sampled_silhouettes(distances, [labels], [k])[0])
+
+def sweep_k(data, k_max: int = AUTO_K["k_max"], sample_size: int = AUTO_K["sample_size"],
+            fit_sample_size: int = AUTO_K["fit_sample_size"], seed: int | None = KMEANS["seed"],
+            max_iter: int = KMEANS["max_iter"], tol: float = KMEANS["tol"], n_jobs: int = KMEANS["n_jobs"],
+            algorithm: str = KMEANS["algorithm"], backend: str = KMEANS["backend"], should_stop=None) -> KSweep:
+    """
+    Fit k = 1..k_max and pick the k with the best sampled silhouette. The fits share their
+    work: one greedy k-means++ run to k_max seeds every k with its first k centers; then, in
+    increasing k, each k is also warm-started from the kept k-1 solution plus one center (the
+    better fit is kept and seeds k+1); and one distance matrix of the silhouette sample serves
+    every k. Inputs above fit_sample_size go through both rounds as a random sample of that
+    size, and a last round refines every k on all points from there, which converges in a few
+    iterations. With the numpy backend, the seeded and the last round spread their k fits over
+    the process pool from AUTO_K["parallel_min_points"] points on; other backends refine
+    every k themselves from the same seeds.
+    """
+    data = np.asarray(data)
+    k_max = min(k_max, len(data))
+    if k_max < 1:
+        raise ValueError("No points to cluster")
+    rng = np.random.default_rng(seed)
+    ks = np.arange(1, k_max + 1)
+    fit = get_backend(backend)
+    n_jobs = min(resolve_n_jobs(n_jobs), k_max)
+    # a sweep has k_max independent fits per round, so it pays for the pool sooner than one fit
+    parallel = fit is fit_numpy and n_jobs > 1
+
+    def refine_one(points: np.ndarray, init: np.ndarray) -> tuple:
+        result = fit(points, len(init), 1, max_iter, tol, seed, init, should_stop, 1, algorithm)
+        return result.inertia, result.centroids, result.n_iter, result.n_skipped
+
+    def refine_all(points: np.ndarray, inits: list) -> list:
+        if parallel and len(points) >= AUTO_K["parallel_min_points"]:
+            return refine_parallel(points, inits, max_iter, tolerance(points, tol), n_jobs, should_stop, algorithm)
+        return [refine_one(points, init) for init in inits]
+
+    fit_data = data
+    if len(data) > fit_sample_size:
+        fit_data = data[rng.choice(len(data), fit_sample_size, replace=False)]
+    seeds = kmeans_plusplus(fit_data, k_max, rng, should_stop=should_stop)
+    fits = refine_all(fit_data, [seeds[:k] for k in ks])
+    check_stop(should_stop)
+    # one k at a time: each seed depends on the fit kept for k-1
+    for k in ks[1:]:
+        warm = refine_one(fit_data, resize_centroids(fit_data, fits[k - 2][1], k, rng))
+        if warm[0] < fits[k - 1][0]:
+            fits[k - 1] = warm
+    if fit_data is not data:
+        fits = refine_all(data, [fit[1] for fit in fits])
+
+    # float32 halves the memory traffic of the distance matrix, far within the score's accuracy
+    sample = data[rng.choice(len(data), min(sample_size, len(data)), replace=False)].astype(np.float32)
+    distances = np.sqrt(sq_distances(sample, sample))
+    check_stop(should_stop)
+    silhouette = np.full(k_max, np.nan)
+    labelings = [assign_labels(sample, fits[k - 1][1].astype(np.float32))[0] for k in ks[1:]]
+    silhouette[1:] = sampled_silhouettes(distances, labelings, ks[1:])
+    best_k = int(ks[np.nanargmax(silhouette)]) if np.isfinite(silhouette).any() else 1
+
+    _, centroids, n_iter, n_skipped = fits[best_k - 1]
+    labels, min_d2 = assign_labels(data, centroids)
+    best = KMeansResult(centroids, labels, float(min_d2.sum()), n_iter, n_skipped)
+    return KSweep(ks, np.array([fit[0] for fit in fits]), silhouette, [fit[1] for fit in fits], best_k, best)
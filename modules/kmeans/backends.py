@@ -0,0 +1,70 @@
+from ..utils import show_msg, LEVEL
+from ..constants import KMEANS
+from .lloyd import tolerance, check_stop
+from .parallel import fit_parallel, resolve_n_jobs
+from .refine import refine
+from .result import KMeansResult
+from .seeding import kmeans_plusplus
+import numpy as np
+
+def fit_numpy(data, k, n_init, max_iter, tol, seed, init=None, should_stop=None, n_jobs=1,
+              algorithm="lloyd") -> KMeansResult:
+    """
+    Built-in engine: k-means++ seeding followed by vectorized Lloyd (or Hamerly), best of
+    n_init runs. Restarts are spread over a process pool when n_jobs allows it and the
+    data is large enough to pay for the shared-memory copy.
+    """
+    rng = np.random.default_rng(seed)
+    tol_abs = tolerance(data, tol)
+    if init is not None:
+        return refine(data, init, max_iter, tol_abs, should_stop, algorithm)
+    n_jobs = min(resolve_n_jobs(n_jobs), n_init)
+    if n_jobs > 1 and len(data) >= KMEANS["parallel_min_points"]:
+        return fit_parallel(data, k, n_init, max_iter, tol_abs, seed, n_jobs, should_stop, algorithm)
+    best = None
+    for _ in range(n_init):
+        check_stop(should_stop)
+        init = kmeans_plusplus(data, k, rng, should_stop=should_stop)
+        result = refine(data, init, max_iter, tol_abs, should_stop, algorithm)
+        if best is None or result.inertia < best.inertia:
+            best = result
+    return best
+
+def fit_sklearn(data, k, n_init, max_iter, tol, seed, init=None, should_stop=None, n_jobs=1,
+                algorithm="lloyd") -> KMeansResult:
+    # sklearn cannot be interrupted mid-fit; a stale result is dropped by the caller instead
+    from sklearn.cluster import KMeans
+    check_stop(should_stop)
+    # sklearn's bound-based variant is Elkan's
+    sk_algorithm = "elkan" if algorithm == "hamerly" else "lloyd"
+    if init is not None:
+        model = KMeans(n_clusters=k, init=init, n_init=1, max_iter=max_iter, tol=tol, random_state=seed,
+                       algorithm=sk_algorithm)
+    else:
+        model = KMeans(n_clusters=k, n_init=n_init, max_iter=max_iter, tol=tol, random_state=seed,
+                       algorithm=sk_algorithm)
+    labels = model.fit_predict(data)
+    return KMeansResult(np.asarray(model.cluster_centers_, dtype=np.float64),
+                        labels.astype(np.int32), float(model.inertia_), int(model.n_iter_))
+
+BACKENDS = {
+    "numpy": fit_numpy,
+    "sklearn": fit_sklearn,
+}
+
+def sklearn_available() -> bool:
+    try:
+        import sklearn.cluster  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def get_backend(name: str):
+    """Return the fit function for a backend, falling back to numpy when unavailable."""
+    if name not in BACKENDS:
+        show_msg(LEVEL["WARNING"], f"Unknown k-means backend '{name}', using numpy.")
+        return fit_numpy
+    if name == "sklearn" and not sklearn_available():
+        show_msg(LEVEL["WARNING"], "scikit-learn is not installed, using numpy backend.")
+        return fit_numpy
+    return BACKENDS[name]
@@ -0,0 +1,50 @@
+from ..constants import KMEANS
+from ..utils import show_msg, LEVEL
+from .backends import get_backend
+from .refine import ALGORITHMS
+from .result import KMeansResult
+from .warmstart import resize_centroids
+import numpy as np
+
+class KMeans:
+    """
+    K-means clusterer with a selectable backend and assignment algorithm.
+    The default "numpy" backend has no dependencies beyond numpy; "sklearn" is optional.
+    algorithm is "lloyd" or "hamerly"; the latter skips distance evaluations that the
+    triangle inequality proves unnecessary and reports how many in KMeansResult.n_skipped.
+    """
+    def __init__(self, n_clusters: int = 3, n_init: int = KMEANS["n_init"],
+                 max_iter: int = KMEANS["max_iter"], tol: float = KMEANS["tol"],
+                 seed: int | None = KMEANS["seed"], backend: str = KMEANS["backend"],
+                 n_jobs: int = KMEANS["n_jobs"], algorithm: str = KMEANS["algorithm"]):
+        self.n_clusters = n_clusters
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.tol = tol
+        self.seed = seed
+        self.backend = backend
+        self.n_jobs = n_jobs
+        if algorithm not in ALGORITHMS:
+            show_msg(LEVEL["WARNING"], f"Unknown k-means algorithm '{algorithm}', using lloyd.")
+            algorithm = "lloyd"
+        self.algorithm = algorithm
+
+    def fit(self, data, init=None, init_weights=None, should_stop=None) -> KMeansResult:
+        """
+        Cluster data. If init holds previous centroids the fit is warm-started
+        from them with a single run; they are merged or extended to n_clusters first.
+        should_stop is polled between iterations; FitCancelled is raised when it returns True.
+        """
+        data = np.asarray(data)
+        if len(data) < self.n_clusters:
+            raise ValueError(f"Need at least {self.n_clusters} points, got {len(data)}")
+        fit = get_backend(self.backend)
+        if init is not None and len(init):
+            init = resize_centroids(data, init, self.n_clusters, np.random.default_rng(self.seed), init_weights)
+        else:
+            init = None
+        return fit(data, self.n_clusters, self.n_init, self.max_iter, self.tol, self.seed, init, should_stop,
+                   self.n_jobs, self.algorithm)
+
+    def fit_predict(self, data, init=None) -> np.ndarray:
+        return self.fit(data, init).labels
@@ -0,0 +1,74 @@
+from ..constants import KMEANS
+from .lloyd import sq_distances, assign_labels, update_centroids, check_stop, tolerance
+import numpy as np
+
+def _nearest_two(data: np.ndarray, centroids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Labels, distance to the nearest and distance to the second nearest centroid."""
+    d2 = sq_distances(data, centroids)
+    labels = d2.argmin(axis=1)
+    if d2.shape[1] == 1:
+        return labels, np.sqrt(d2[:, 0]), np.full(len(data), np.inf)
+    two = np.partition(d2, 1, axis=1)
+    return labels, np.sqrt(two[:, 0]), np.sqrt(two[:, 1])
+
+def hamerly(data: np.ndarray, centroids: np.ndarray, max_iter: int = KMEANS["max_iter"],
+            tol: float = KMEANS["tol"], tol_abs: float | None = None,
+            should_stop=None) -> tuple[np.ndarray, np.ndarray, float, int, int]:
+    """
+    Hamerly's accelerated k-means. Gives the same result as lloyd() up to floating-point
+    ties, but keeps per point an upper bound on the distance to its centroid and a lower
+    bound on the distance to any other one, and only recomputes distances for points
+    whose bounds overlap. Returns (centroids, labels, inertia, n_iter, n_skipped), where
+    n_skipped counts the point-centroid distances plain Lloyd would have evaluated but
+    this did not.
+    """
+    data64 = np.asarray(data, dtype=np.float64)
+    centroids = np.array(centroids, dtype=np.float64)
+    if tol_abs is None:
+        tol_abs = tolerance(data, tol)
+    n = len(data64)
+    k = len(centroids)
+    labels, upper, lower = _nearest_two(data64, centroids)
+    n_computed = n * k
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        check_stop(should_stop)
+        min_d2 = None
+        if np.bincount(labels, minlength=k).min() == 0:
+            # empty clusters are relocated like lloyd() does, which needs exact distances
+            min_d2 = ((data64 - centroids[labels]) ** 2).sum(axis=1)
+            n_computed += n
+        new, _ = update_centroids(data64, labels, min_d2, centroids)
+        shift = np.sqrt(((new - centroids) ** 2).sum(axis=1))
+        centroids = new
+        if float((shift ** 2).sum()) <= tol_abs:
+            break
+
+        # move the bounds by how far the centroids moved
+        upper += shift[labels]
+        if k > 1:
+            order = np.argsort(shift)
+            max1, max2 = shift[order[-1]], shift[order[-2]]
+            lower -= np.where(labels == order[-1], max2, max1)
+            cc = np.sqrt(sq_distances(centroids, centroids))
+            np.fill_diagonal(cc, np.inf)
+            half_gap = 0.5 * cc.min(axis=1)
+        else:
+            half_gap = np.full(1, np.inf)
+        bound = np.maximum(half_gap[labels], lower)
+
+        # tighten the upper bound of the uncertain points, then fully reassign what is left
+        idx = np.flatnonzero(upper > bound)
+        if len(idx):
+            diff = data64[idx] - centroids[labels[idx]]
+            upper[idx] = np.sqrt((diff ** 2).sum(axis=1))
+            n_computed += len(idx)
+            idx = idx[upper[idx] > bound[idx]]
+        if len(idx):
+            labels[idx], upper[idx], lower[idx] = _nearest_two(data64[idx], centroids)
+            n_computed += len(idx) * k
+    # final assignment, exactly as lloyd() does
+    labels, min_d2 = assign_labels(data, centroids)
+    n_computed += n * k
+    n_skipped = (n_iter + 1) * n * k - n_computed
+    return centroids, labels, float(min_d2.sum()), n_iter, int(n_skipped)
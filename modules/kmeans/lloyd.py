@@ -0,0 +1,139 @@
+from ..constants import KMEANS
+import numpy as np
+
+class FitCancelled(Exception):
+    """Raised inside a fit when its should_stop callback returns True."""
+
+def check_stop(should_stop) -> None:
+    if should_stop is not None and should_stop():
+        raise FitCancelled()
+
+def sq_distances(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """(n, k) squared distances, unrolled for the 2-D case the canvas produces."""
+    if data.shape[1] == 2:
+        dx = data[:, 0, None] - centroids[None, :, 0]
+        dy = data[:, 1, None] - centroids[None, :, 1]
+        dx *= dx
+        dy *= dy
+        dx += dy
+        return dx
+    diff = data[:, None, :] - centroids[None, :, :]
+    return np.einsum("nkd,nkd->nk", diff, diff)
+
+def assign_blocks(data: np.ndarray, centroids: np.ndarray, labels: np.ndarray, min_d2: np.ndarray,
+                  chunk_size: int = KMEANS["chunk_size"]):
+    """Fill labels and min_d2 one row block at a time, yielding the end row of each block."""
+    n = len(data)
+    # distances in the data's own precision: float32 halves the memory traffic
+    dtype = data.dtype if data.dtype in (np.float32, np.float64) else np.float64
+    centroids = np.asarray(centroids, dtype=dtype)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        d2 = sq_distances(data[start:stop], centroids)
+        idx = d2.argmin(axis=1)
+        labels[start:stop] = idx
+        min_d2[start:stop] = np.take_along_axis(d2, idx[:, None], axis=1)[:, 0]
+        yield stop
+
+def assign_labels(data: np.ndarray, centroids: np.ndarray,
+                  chunk_size: int = KMEANS["chunk_size"]) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest-centroid labels and their squared distances, computed in row blocks."""
+    n = len(data)
+    labels = np.empty(n, dtype=np.int32)
+    min_d2 = np.empty(n, dtype=np.float64)
+    for _ in assign_blocks(data, centroids, labels, min_d2, chunk_size):
+        pass
+    return labels, min_d2
+
+def update_centroids(data: np.ndarray, labels: np.ndarray, min_d2: np.ndarray,
+                     centroids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Recompute means with bincount. Empty clusters are moved to the worst-fitted points."""
+    k = len(centroids)
+    counts = np.bincount(labels, minlength=k)
+    new = np.empty((k, data.shape[1]), dtype=np.float64)
+    for d in range(data.shape[1]):
+        new[:, d] = np.bincount(labels, weights=data[:, d], minlength=k)
+    filled = counts > 0
+    new[filled] /= counts[filled, None]
+    n_empty = k - int(filled.sum())
+    if n_empty:
+        far = np.argpartition(min_d2, -n_empty)[-n_empty:]
+        new[~filled] = data[far]
+    return new, counts
+
+def tolerance(data: np.ndarray, tol: float) -> float:
+    """Scale tol by the mean per-axis variance, the way sklearn does."""
+    if tol == 0 or len(data) == 0:
+        return 0.0
+    return float(np.mean(np.var(data, axis=0, dtype=np.float64)) * tol)
+
+def lloyd(data: np.ndarray, centroids: np.ndarray, max_iter: int = KMEANS["max_iter"],
+          tol: float = KMEANS["tol"], tol_abs: float | None = None,
+          should_stop=None) -> tuple[np.ndarray, np.ndarray, float, int]:
+    """Run Lloyd iterations from the given centroids. Returns (centroids, labels, inertia, n_iter)."""
+    centroids = np.array(centroids, dtype=np.float64)
+    if tol_abs is None:
+        tol_abs = tolerance(data, tol)
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        check_stop(should_stop)
+        labels, min_d2 = assign_labels(data, centroids)
+        new, _ = update_centroids(data, labels, min_d2, centroids)
+        shift = float(((new - centroids) ** 2).sum())
+        centroids = new
+        if shift <= tol_abs:
+            break
+    labels, min_d2 = assign_labels(data, centroids)
+    return centroids, labels, float(min_d2.sum()), n_iter
+
+def lloyd_steps(data: np.ndarray, centroids: np.ndarray, max_iter: int = KMEANS["max_iter"],
+                tol: float = KMEANS["tol"], chunk_size: int = KMEANS["chunk_size"]):
+    """
+    Lloyd's algorithm as a resumable generator of (phase, n_iter, labels, centroids, inertia).
+    Phases: "init", then per iteration "assign" and "update", and finally "done" (the only
+    step carrying an inertia). "partial" is yielded between assignment blocks so a caller
+    with a time budget can pause mid-pass; cluster sums are accumulated per block for the
+    same reason, which keeps every step O(chunk_size * k). The labels array is reused.
+    """
+    centroids = np.array(centroids, dtype=np.float64)
+    n, dim = data.shape
+    k = len(centroids)
+    labels = np.empty(n, dtype=np.int32)
+    min_d2 = np.empty(n, dtype=np.float64)
+    tol_abs = None
+    yield "init", 0, None, centroids, None
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        counts = np.zeros(k, dtype=np.int64)
+        sums = np.zeros((k, dim), dtype=np.float64)
+        sq_sums = np.zeros(dim, dtype=np.float64) if tol_abs is None else None
+        start = 0
+        for stop in assign_blocks(data, centroids, labels, min_d2, chunk_size):
+            block, block_labels = data[start:stop], labels[start:stop]
+            counts += np.bincount(block_labels, minlength=k)
+            for d in range(dim):
+                sums[:, d] += np.bincount(block_labels, weights=block[:, d], minlength=k)
+                if sq_sums is not None:
+                    sq_sums[d] += np.dot(block[:, d].astype(np.float64), block[:, d])
+            start = stop
+            if stop < n:
+                yield "partial", n_iter, labels, centroids, None
+        if tol_abs is None:
+            mean = sums.sum(axis=0) / n
+            tol_abs = float(np.mean(sq_sums / n - mean ** 2) * tol)
+        yield "assign", n_iter, labels, centroids, None
+        new = centroids.copy()
+        filled = counts > 0
+        new[filled] = sums[filled] / counts[filled, None]
+        n_empty = k - int(filled.sum())
+        if n_empty:
+            new[~filled] = data[np.argpartition(min_d2, -n_empty)[-n_empty:]]
+        shift = float(((new - centroids) ** 2).sum())
+        centroids = new
+        yield "update", n_iter, labels, centroids, None
+        if shift <= tol_abs:
+            break
+    for stop in assign_blocks(data, centroids, labels, min_d2, chunk_size):
+        if stop < n:
+            yield "partial", n_iter, labels, centroids, None
+    yield "done", n_iter, labels, centroids, float(min_d2.sum())
@@ -0,0 +1,38 @@
+from .lloyd import assign_labels
+import numpy as np
+
+class OnlineKMeans:
+    """
+    Sequential k-means (MacQueen's rule): every new point moves its nearest
+    centroid towards it by 1/count, so each update costs O(k).
+    """
+    def __init__(self, centroids, counts=None):
+        self.centroids = np.array(centroids, dtype=np.float64)
+        k = len(self.centroids)
+        self.counts = np.ones(k) if counts is None else np.maximum(np.asarray(counts, dtype=np.float64), 1.0)
+
+    def partial_fit_point(self, x: float, y: float) -> int:
+        """Assign one point, update its centroid and return its label."""
+        c = self.centroids
+        dx = c[:, 0] - x
+        dy = c[:, 1] - y
+        label = int(np.argmin(dx * dx + dy * dy))
+        self.counts[label] += 1
+        eta = 1.0 / self.counts[label]
+        c[label, 0] -= eta * dx[label]
+        c[label, 1] -= eta * dy[label]
+        return label
+
+    def partial_fit(self, batch: np.ndarray) -> np.ndarray:
+        """Mini-batch update with per-cluster learning rates. Returns the batch labels."""
+        batch = np.asarray(batch)
+        k = len(self.centroids)
+        labels, _ = assign_labels(batch, self.centroids)
+        batch_counts = np.bincount(labels, minlength=k)
+        hit = batch_counts > 0
+        self.counts += batch_counts
+        for d in range(batch.shape[1]):
+            sums = np.bincount(labels, weights=batch[:, d], minlength=k)
+            # c <- c + (sum - m*c) / count, i.e. the running mean including the batch
+            self.centroids[hit, d] += (sums[hit] - batch_counts[hit] * self.centroids[hit, d]) / self.counts[hit]
+        return labels
@@ -0,0 +1,146 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from .lloyd import assign_labels, FitCancelled
+from .refine import refine
+from .result import KMeansResult
+from .seeding import kmeans_plusplus
+import atexit
+import os
+import threading
+import numpy as np
+
+# Shared block layout: one cancel flag, padded to 8 bytes, then the (n, d) point array.
+_HEADER = 8
+
+_pool = None
+_pool_size = 0
+# the prewarmer and the cluster worker threads may both reach for the pool
+_pool_lock = threading.Lock()
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """-1 or None means one worker per core."""
+    cores = os.cpu_count() or 1
+    if n_jobs is None or n_jobs < 0:
+        return cores
+    return max(1, min(n_jobs, cores))
+
+def get_pool(n_jobs: int) -> ProcessPoolExecutor:
+    """Lazily start (or resize) the shared process pool. Spawned, so it is safe next to threads."""
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size != n_jobs:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=n_jobs, mp_context=get_context("spawn"))
+            _pool_size = n_jobs
+        return _pool
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+atexit.register(shutdown_pool)
+
+@contextmanager
+def shared_points(data: np.ndarray):
+    """Copy data once into a new shared block; yields the block and its cancel flag, unlinked on exit."""
+    shm = SharedMemory(create=True, size=_HEADER + data.nbytes)
+    flag = np.ndarray((1,), dtype=np.uint8, buffer=shm.buf)
+    flag[0] = 0
+    try:
+        shared = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf, offset=_HEADER)
+        shared[:] = data
+        del shared
+        yield shm, flag
+    finally:
+        del flag
+        shm.close()
+        shm.unlink()
+
+def wait_all(pending: set, flag: np.ndarray, should_stop=None, on_done=None) -> None:
+    """Wait for the futures, polling should_stop; on cancel the workers see the flag and FitCancelled is raised."""
+    while pending:
+        done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+        if on_done is not None:
+            for future in done:
+                on_done(future.result())
+        if should_stop is not None and should_stop():
+            flag[0] = 1
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            raise FitCancelled()
+
+def _restart(shm_name, shape, dtype, k, seed_seq, max_iter, tol_abs, algorithm):
+    """One k-means++ + refinement restart on the shared array. Returns (inertia, centroids, n_iter, n_skipped)."""
+    # pool workers share the parent's resource tracker, so attaching does not take ownership
+    shm = SharedMemory(name=shm_name)
+    flag = np.ndarray((1,), dtype=np.uint8, buffer=shm.buf)
+    data = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=_HEADER)
+    try:
+        rng = np.random.default_rng(seed_seq)
+        should_stop = lambda: flag[0] != 0
+        init = kmeans_plusplus(data, k, rng, should_stop=should_stop)
+        result = refine(data, init, max_iter, tol_abs, should_stop, algorithm)
+        return result.inertia, result.centroids, result.n_iter, result.n_skipped
+    except FitCancelled:
+        return None
+    finally:
+        del flag, data
+        shm.close()
+
+def _refine_shared(shm_name, shape, dtype, init, max_iter, tol_abs, algorithm):
+    """One refinement from given centroids on the shared array. Returns (inertia, centroids, n_iter, n_skipped)."""
+    shm = SharedMemory(name=shm_name)
+    flag = np.ndarray((1,), dtype=np.uint8, buffer=shm.buf)
+    data = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=_HEADER)
+    try:
+        result = refine(data, init, max_iter, tol_abs, lambda: flag[0] != 0, algorithm)
+        return result.inertia, result.centroids, result.n_iter, result.n_skipped
+    except FitCancelled:
+        return None
+    finally:
+        del flag, data
+        shm.close()
+
+def refine_parallel(data, inits, max_iter, tol_abs, n_jobs, should_stop=None, algorithm="lloyd") -> list:
+    """
+    Refine every initial centroid array in inits across the process pool, sharing one copy
+    of the points. Returns (inertia, centroids, n_iter, n_skipped) per init, in order.
+    """
+    data = np.ascontiguousarray(data)
+    with shared_points(data) as (shm, flag):
+        pool = get_pool(n_jobs)
+        futures = [pool.submit(_refine_shared, shm.name, data.shape, data.dtype.str, init, max_iter, tol_abs,
+                               algorithm) for init in inits]
+        wait_all(set(futures), flag, should_stop)
+        return [future.result() for future in futures]
+
+def fit_parallel(data, k, n_init, max_iter, tol_abs, seed, n_jobs, should_stop=None,
+                 algorithm="lloyd") -> KMeansResult:
+    """
+    Run n_init restarts across the process pool. The points are copied once into shared
+    memory; workers return only centroids and inertia, and the labels of the best run are
+    computed here with a single assignment pass.
+    """
+    data = np.ascontiguousarray(data)
+    with shared_points(data) as (shm, flag):
+        pool = get_pool(n_jobs)
+        seeds = np.random.SeedSequence(seed).spawn(n_init)
+        pending = {pool.submit(_restart, shm.name, data.shape, data.dtype.str, k, s, max_iter, tol_abs, algorithm)
+                   for s in seeds}
+        best = None
+
+        def keep_best(out):
+            nonlocal best
+            if out is not None and (best is None or out[0] < best[0]):
+                best = out
+        wait_all(pending, flag, should_stop, keep_best)
+    inertia, centroids, n_iter, n_skipped = best
+    labels, min_d2 = assign_labels(data, centroids)
+    return KMeansResult(centroids, labels, float(min_d2.sum()), n_iter, n_skipped)
@@ -0,0 +1,11 @@
+from .hamerly import hamerly
+from .lloyd import lloyd
+from .result import KMeansResult
+
+ALGORITHMS = ("lloyd", "hamerly")
+
+def refine(data, init, max_iter, tol_abs, should_stop=None, algorithm="lloyd") -> KMeansResult:
+    """Run one k-means refinement from init with the chosen assignment algorithm."""
+    if algorithm == "hamerly":
+        return KMeansResult(*hamerly(data, init, max_iter, tol_abs=tol_abs, should_stop=should_stop))
+    return KMeansResult(*lloyd(data, init, max_iter, tol_abs=tol_abs, should_stop=should_stop))
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass
+class KMeansResult:
+    centroids: np.ndarray   # (k, 2) float64
+    labels: np.ndarray      # (n,) int32
+    inertia: float
+    n_iter: int
+    n_skipped: int = 0      # distance evaluations avoided by the accelerated algorithm
@@ -0,0 +1,43 @@
+from .lloyd import sq_distances, check_stop
+import numpy as np
+
+def kmeans_plusplus(data: np.ndarray, k: int, rng: np.random.Generator,
+                    n_local_trials: int | None = None, centers: np.ndarray | None = None,
+                    should_stop=None) -> np.ndarray:
+    """
+    Greedy k-means++ seeding. Returns a (k, 2) float64 array of initial centroids.
+    If centers is given, seeding continues from those instead of starting over.
+    """
+    n = len(data)
+    if n_local_trials is None:
+        n_local_trials = 2 + int(np.log(k))
+    seeded = np.empty((k, data.shape[1]), dtype=np.float64)
+    if centers is not None and len(centers):
+        start = min(len(centers), k)
+        seeded[:start] = centers[:start]
+        closest = sq_distances(data, seeded[:start].astype(data.dtype)).min(axis=1)
+    else:
+        start = 1
+        first = rng.integers(n)
+        seeded[0] = data[first]
+        closest = sq_distances(data, data[first:first + 1])[:, 0]
+    centers = seeded
+    potential = float(closest.sum(dtype=np.float64))
+
+    for c in range(start, k):
+        check_stop(should_stop)
+        if potential <= 0:
+            # every point sits on a chosen center, any pick is as good as another
+            centers[c] = data[rng.integers(n)]
+            continue
+        rand_vals = rng.random(n_local_trials) * potential
+        candidates = np.searchsorted(np.cumsum(closest, dtype=np.float64), rand_vals)
+        np.clip(candidates, 0, n - 1, out=candidates)
+        cand_d2 = sq_distances(data, data[candidates]).T
+        np.minimum(closest, cand_d2, out=cand_d2)
+        cand_potential = cand_d2.sum(axis=1, dtype=np.float64)
+        best = int(np.argmin(cand_potential))
+        centers[c] = data[candidates[best]]
+        closest = cand_d2[best]
+        potential = cand_potential[best]
+    return centers
@@ -0,0 +1,110 @@
+import numpy as np
+
+class ClusterStats:
+    """
+    Per-cluster statistics of a clustering:
+    - sizes: (k,) int64 member counts
+    - centroids: (k, 2) float64
+    - inertia: (k,) sum of squared distances to the centroid
+    - radius: (k,) distance of the farthest member, 0 when empty
+    - bbox_min, bbox_max: (k, 2) corners of the members' bounding box, nan when empty
+    Values not given are computed from data and labels when first read, so those arrays
+    must not change until then. The UI reads only sizes and centroids.
+    """
+    def __init__(self, sizes, centroids, inertia=None, radius=None, bbox_min=None, bbox_max=None,
+                 data=None, labels=None):
+        self.sizes = sizes
+        self.centroids = centroids
+        self._inertia = inertia
+        self._radius = radius
+        self._bbox_min = bbox_min
+        self._bbox_max = bbox_max
+        self._data = data
+        self._labels = labels
+
+    @property
+    def inertia(self) -> np.ndarray:
+        if self._inertia is None:
+            data, labels = self._data, self._labels.astype(np.intp)
+            # column by column (axis=1 reductions over (n, 2) are slow), summed per cluster
+            # by a weighted bincount
+            d2 = np.zeros(len(labels))
+            for d in range(data.shape[1]):
+                diff = data[:, d].astype(np.float64)
+                diff -= self.centroids[:, d].take(labels)
+                diff *= diff
+                d2 += diff
+            self._inertia = np.bincount(labels, weights=d2, minlength=len(self.sizes))[:len(self.sizes)]
+        return self._inertia
+
+    @property
+    def total_inertia(self) -> float:
+        return float(self.inertia.sum())
+
+    @property
+    def radius(self) -> np.ndarray:
+        if self._radius is None:
+            self._grouped()
+        return self._radius
+
+    @property
+    def bbox_min(self) -> np.ndarray:
+        if self._bbox_min is None:
+            self._grouped()
+        return self._bbox_min
+
+    @property
+    def bbox_max(self) -> np.ndarray:
+        if self._bbox_max is None:
+            self._grouped()
+        return self._bbox_max
+
+    def _grouped(self) -> None:
+        """
+        Radius and bounding boxes, which have no weighted-bincount form: points are grouped
+        once with a stable sort on the labels and each cluster is reduced as one slice.
+        """
+        data, labels, sizes = self._data, self._labels, self.sizes
+        k, dims = len(sizes), data.shape[1]
+        order = np.argsort(labels, kind="stable")
+        # gathering contiguous columns is several times faster than gathering (n, 2) rows
+        columns = [np.ascontiguousarray(data[:, d]).take(order) for d in range(dims)]
+        stops = np.cumsum(sizes)
+        bbox_min = np.full((k, dims), np.nan)
+        bbox_max = np.full((k, dims), np.nan)
+        radius = np.zeros(k)
+        for c in np.flatnonzero(sizes):
+            d2 = 0
+            for d, column in enumerate(columns):
+                segment = column[stops[c] - sizes[c]:stops[c]]
+                bbox_min[c, d] = segment.min()
+                bbox_max[c, d] = segment.max()
+                diff = segment - column.dtype.type(self.centroids[c, d])
+                diff *= diff
+                d2 = d2 + diff
+            radius[c] = np.sqrt(d2.max())
+        self._radius, self._bbox_min, self._bbox_max = radius, bbox_min, bbox_max
+
+def cluster_stats(data: np.ndarray, labels: np.ndarray, k: int | None = None,
+                  centroids: np.ndarray | None = None) -> ClusterStats:
+    """
+    Per-cluster statistics in O(n) without sorting: sizes, and member means when no centroids
+    are given, are (weighted) bincounts. Inertia, radius and bounding boxes are left to the
+    first read. Points labeled -1 are ignored. Without centroids, the member means are used.
+    """
+    labels = np.asarray(labels)
+    if k is None:
+        k = int(labels.max()) + 1 if len(labels) else 0
+    if len(labels) and labels.min() < 0:
+        assigned = labels >= 0
+        data, labels = data[assigned], labels[assigned]
+    if data.dtype.kind != "f":
+        data = data.astype(np.float64)
+    sizes = np.bincount(labels, minlength=k)[:k]
+    if centroids is None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centroids = np.stack([np.bincount(labels, weights=data[:, d], minlength=k)[:k] / sizes
+                                  for d in range(data.shape[1])], axis=1)
+    else:
+        centroids = np.asarray(centroids, dtype=np.float64)
+    return ClusterStats(sizes, centroids, data=data, labels=labels)
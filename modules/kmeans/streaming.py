@@ -0,0 +1,135 @@
+from ..constants import KMEANS, STREAMING
+from .engine import KMeans
+from .lloyd import assign_labels
+from .online import OnlineKMeans
+from .result import KMeansResult
+from .stats import ClusterStats, cluster_stats
+from itertools import islice
+import os
+import numpy as np
+
+def csv_skiprows(path: str) -> int:
+    """1 if the first line of a text point file is a header, else 0."""
+    with open(path) as f:
+        first = f.readline()
+    try:
+        [float(v) for v in first.replace(",", " ").split()]
+        return 0
+    except ValueError:
+        return 1
+
+def iter_chunks(source, chunk_size: int, columns: list[int] | None = None):
+    """
+    Yield (m, d) float arrays of at most chunk_size rows from an array (a memmap works),
+    an .npy file, which is memory-mapped, or a .csv/.txt file, which is parsed one chunk at a time.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        ext = os.path.splitext(source)[1].lower()
+        if ext in (".csv", ".txt"):
+            delimiter = "," if ext == ".csv" else None
+            with open(source) as f:
+                for _ in range(csv_skiprows(source)):
+                    f.readline()
+                while True:
+                    lines = list(islice(f, chunk_size))
+                    if not lines:
+                        return
+                    yield np.loadtxt(lines, delimiter=delimiter, ndmin=2, usecols=columns)
+        if ext != ".npy":
+            raise ValueError(f"Cannot stream '{source}', expected .npy, .csv or .txt")
+        source = np.load(source, mmap_mode="r")
+    for start in range(0, len(source), chunk_size):
+        chunk = np.asarray(source[start:start + chunk_size])
+        if columns is not None:
+            chunk = chunk[:, columns]
+        yield chunk if chunk.dtype in (np.float32, np.float64) else chunk.astype(np.float64)
+
+def merge_stats(a: ClusterStats | None, b: ClusterStats) -> ClusterStats:
+    """Combine the statistics of two disjoint point sets clustered with the same centroids."""
+    if a is None:
+        return b
+    return ClusterStats(a.sizes + b.sizes, a.centroids, a.inertia + b.inertia, np.maximum(a.radius, b.radius),
+                        np.fmin(a.bbox_min, b.bbox_min), np.fmax(a.bbox_max, b.bbox_max))
+
+class StreamingKMeans:
+    """
+    K-means for point files larger than memory. One pass draws a reservoir sample, which is
+    clustered in memory to seed the centroids; n_epochs mini-batch passes refine them, and a
+    last pass writes the labels to a memory-mapped .npy. Peak memory follows chunk_size and
+    sample_size, not the number of points. n_init, max_iter, tol, backend, n_jobs and algorithm
+    configure the KMeans fit of the sample.
+    """
+    def __init__(self, n_clusters: int = 3, chunk_size: int = STREAMING["chunk_size"],
+                 sample_size: int = STREAMING["sample_size"], n_epochs: int = STREAMING["n_epochs"],
+                 seed: int | None = KMEANS["seed"], n_init: int = KMEANS["n_init"],
+                 max_iter: int = KMEANS["max_iter"], tol: float = KMEANS["tol"],
+                 backend: str = KMEANS["backend"], n_jobs: int = KMEANS["n_jobs"],
+                 algorithm: str = KMEANS["algorithm"]):
+        self.n_clusters = n_clusters
+        self.chunk_size = chunk_size
+        self.sample_size = sample_size
+        self.n_epochs = n_epochs
+        self.seed = seed
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.tol = tol
+        self.backend = backend
+        self.n_jobs = n_jobs
+        self.algorithm = algorithm
+        self.sample = None          # reservoir sample of the points, for seeding and display
+        self.sample_labels = None
+        self.stats = None
+
+    def _reservoir(self, source, columns, rng) -> tuple[np.ndarray, int]:
+        """Uniform sample of up to sample_size points (Algorithm R, vectorized per chunk) and the total count."""
+        size = self.sample_size
+        sample = None
+        n = 0
+        for chunk in iter_chunks(source, self.chunk_size, columns):
+            if sample is None:
+                sample = np.empty((size, chunk.shape[1]), dtype=chunk.dtype)
+            fill = max(0, min(size - n, len(chunk)))
+            sample[n:n + fill] = chunk[:fill]
+            # row i (0-based, overall) replaces slot j ~ U[0, i] when j < size
+            slots = rng.integers(0, np.arange(n + fill, n + len(chunk)) + 1)
+            keep = slots < size
+            sample[slots[keep]] = chunk[fill:][keep]
+            n += len(chunk)
+        if sample is None:
+            raise ValueError("No points to cluster")
+        return sample[:min(n, size)], n
+
+    def fit(self, source, labels_path: str | None = None, columns: list[int] | None = None) -> KMeansResult:
+        """
+        Cluster every point of source. Labels go to a memory-mapped int32 .npy at labels_path,
+        or to an in-memory array when it is None.
+        """
+        rng = np.random.default_rng(self.seed)
+        sample, n = self._reservoir(source, columns, rng)
+        if n < self.n_clusters:
+            raise ValueError(f"Need at least {self.n_clusters} points, got {n}")
+        seeded = KMeans(self.n_clusters, n_init=self.n_init, max_iter=self.max_iter, tol=self.tol, seed=self.seed,
+                        backend=self.backend, n_jobs=self.n_jobs, algorithm=self.algorithm).fit(sample)
+        model = OnlineKMeans(seeded.centroids, np.bincount(seeded.labels, minlength=self.n_clusters))
+        for _ in range(self.n_epochs):
+            for chunk in iter_chunks(source, self.chunk_size, columns):
+                model.partial_fit(chunk)
+        centroids = model.centroids
+
+        if labels_path is None:
+            labels = np.empty(n, dtype=np.int32)
+        else:
+            labels = np.lib.format.open_memmap(labels_path, mode="w+", dtype=np.int32, shape=(n,))
+        stats = None
+        start = 0
+        for chunk in iter_chunks(source, self.chunk_size, columns):
+            chunk_labels, _ = assign_labels(chunk, centroids)
+            labels[start:start + len(chunk)] = chunk_labels
+            stats = merge_stats(stats, cluster_stats(chunk, chunk_labels, self.n_clusters, centroids))
+            start += len(chunk)
+        if isinstance(labels, np.memmap):
+            labels.flush()
+        self.sample = sample
+        self.sample_labels, _ = assign_labels(sample, centroids)
+        self.stats = stats
+        return KMeansResult(centroids, labels, stats.total_inertia, self.n_epochs)
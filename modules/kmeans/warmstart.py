@@ -0,0 +1,34 @@
+from .seeding import kmeans_plusplus
+import numpy as np
+
+def merge_closest(centroids: np.ndarray, weights: np.ndarray, k: int) -> np.ndarray:
+    """Merge the closest pair of centroids (weighted mean) until only k remain."""
+    centroids = [np.asarray(c, dtype=np.float64) for c in centroids]
+    weights = [max(float(w), 1.0) for w in weights]
+    while len(centroids) > k:
+        arr = np.array(centroids)
+        d2 = ((arr[:, None, :] - arr[None, :, :]) ** 2).sum(axis=2)
+        np.fill_diagonal(d2, np.inf)
+        i, j = np.unravel_index(np.argmin(d2), d2.shape)
+        i, j = min(i, j), max(i, j)
+        w = weights[i] + weights[j]
+        centroids[i] = (centroids[i] * weights[i] + centroids[j] * weights[j]) / w
+        weights[i] = w
+        del centroids[j], weights[j]
+    return np.array(centroids)
+
+def resize_centroids(data: np.ndarray, centroids: np.ndarray, k: int, rng: np.random.Generator,
+                     weights: np.ndarray | None = None) -> np.ndarray:
+    """
+    Adapt a previous set of centroids to k clusters.
+    Extra centroids are merged pairwise; missing ones are added by continuing
+    k-means++ from the existing ones, which splits the worst-fitted clusters.
+    """
+    centroids = np.asarray(centroids, dtype=np.float64)
+    if len(centroids) > k:
+        if weights is None or len(weights) != len(centroids):
+            weights = np.ones(len(centroids))
+        return merge_closest(centroids, weights, k)
+    if len(centroids) < k:
+        return kmeans_plusplus(data, k, rng, centers=centroids)
+    return centroids.copy()
@@ -0,0 +1,149 @@
+"""
+Headless k-means on point files, without pygame.
+
+    python -m modules.kmeans_cli points.csv -k 5 --seed 0 -o result.npz --summary result.json
+    python -m modules.kmeans_cli huge.npy -k 5 --stream --labels-out labels.npy
+"""
+from .constants import KMEANS, STREAMING
+from .kmeans import ALGORITHMS, BACKENDS, KMeans, StreamingKMeans, cluster_stats
+from .kmeans.streaming import csv_skiprows
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+
+LOADERS = (".csv", ".txt", ".npy", ".npz")
+
+def load_points(path: str, key: str | None = None, columns: list[int] | None = None) -> np.ndarray:
+    """Read an (n, d) point array from CSV/TXT, NPY (memory-mapped) or NPZ."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        points = np.load(path, mmap_mode="r")
+    elif ext == ".npz":
+        with np.load(path) as archive:
+            if not archive.files:
+                raise ValueError(f"'{path}' holds no arrays")
+            name = key or ("points" if "points" in archive.files else archive.files[0])
+            points = archive[name]
+    elif ext in (".csv", ".txt"):
+        delimiter = "," if ext == ".csv" else None
+        points = np.loadtxt(path, delimiter=delimiter, skiprows=csv_skiprows(path), ndmin=2, usecols=columns)
+        columns = None
+    else:
+        raise ValueError(f"Unsupported point file '{path}', expected one of {', '.join(LOADERS)}")
+    if points.ndim != 2:
+        raise ValueError(f"Expected an (n, d) array, got shape {points.shape}")
+    if columns is not None:
+        points = points[:, columns]
+    if points.dtype not in (np.float32, np.float64):
+        points = points.astype(np.float64)
+    return points
+
+def summarize(result, stats, n: int, seconds: float) -> dict:
+    return {
+        "n_points": n,
+        "k": len(result.centroids),
+        "inertia": float(result.inertia),
+        "n_iter": int(result.n_iter),
+        "fit_seconds": seconds,
+        "clusters": [
+            {
+                "size": int(stats.sizes[i]),
+                "centroid": stats.centroids[i].tolist(),
+                "inertia": float(stats.inertia[i]),
+                "radius": float(stats.radius[i]),
+                "bbox_min": stats.bbox_min[i].tolist(),
+                "bbox_max": stats.bbox_max[i].tolist(),
+            }
+            for i in range(len(stats.sizes))
+        ],
+    }
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m modules.kmeans_cli",
+                                     description="Cluster a point file with the visualizer's k-means engine.")
+    parser.add_argument("input", help="points as .csv/.txt, .npy or .npz (one point per row)")
+    parser.add_argument("-k", "--clusters", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=KMEANS["seed"])
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=KMEANS["backend"])
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default=KMEANS["algorithm"])
+    parser.add_argument("--n-init", type=int, default=KMEANS["n_init"])
+    parser.add_argument("--max-iter", type=int, default=KMEANS["max_iter"])
+    parser.add_argument("--tol", type=float, default=KMEANS["tol"])
+    parser.add_argument("--n-jobs", type=int, default=KMEANS["n_jobs"])
+    parser.add_argument("--key", help="array name inside an .npz (default: 'points' or the first array)")
+    parser.add_argument("--columns", type=int, nargs="+", help="columns to use as coordinates")
+    parser.add_argument("-o", "--output", help="result .npz (default: <input>_kmeans.npz)")
+    parser.add_argument("--summary", help="also write the summary and per-cluster statistics as JSON")
+    stream = parser.add_argument_group("streaming", "cluster files larger than memory (.npy, .csv, .txt)")
+    stream.add_argument("--stream", action="store_true", help="read the input in chunks with mini-batch updates")
+    stream.add_argument("--chunk-size", type=int, default=STREAMING["chunk_size"])
+    stream.add_argument("--sample-size", type=int, default=STREAMING["sample_size"],
+                        help="points kept in the output for display on the canvas")
+    stream.add_argument("--epochs", type=int, default=STREAMING["n_epochs"])
+    stream.add_argument("--labels-out", help="memory-mapped label .npy (default: <output>_labels.npy)")
+    return parser
+
+def run_streaming(args) -> int:
+    output = args.output or os.path.splitext(args.input)[0] + "_kmeans.npz"
+    labels_out = args.labels_out or os.path.splitext(output)[0] + "_labels.npy"
+    model = StreamingKMeans(args.clusters, chunk_size=args.chunk_size, sample_size=args.sample_size,
+                            n_epochs=args.epochs, seed=args.seed, n_init=args.n_init, max_iter=args.max_iter,
+                            tol=args.tol, backend=args.backend, n_jobs=args.n_jobs, algorithm=args.algorithm)
+    start = time.perf_counter()
+    try:
+        result = model.fit(args.input, labels_out, args.columns)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    stats = model.stats
+    # the sample goes in as points/labels so the canvas can load the file directly
+    np.savez(output, centroids=result.centroids, sizes=stats.sizes, inertia=stats.inertia, radius=stats.radius,
+             bbox_min=stats.bbox_min, bbox_max=stats.bbox_max, points=model.sample, labels=model.sample_labels)
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summarize(result, stats, len(result.labels), seconds), f, indent=2)
+    print(f"{len(result.labels)} points, k={args.clusters}: inertia {result.inertia:.6g} in {seconds:.3f}s "
+          f"-> {output}, labels in {labels_out}")
+    return 0
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.stream:
+        # .npz archives cannot be streamed, so there is no array to pick
+        if args.key is not None:
+            parser.error("--key does not apply with --stream")
+        return run_streaming(args)
+    try:
+        points = load_points(args.input, args.key, args.columns)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    model = KMeans(n_clusters=args.clusters, n_init=args.n_init, max_iter=args.max_iter, tol=args.tol,
+                   seed=args.seed, backend=args.backend, n_jobs=args.n_jobs, algorithm=args.algorithm)
+    start = time.perf_counter()
+    try:
+        result = model.fit(points)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    stats = cluster_stats(points, result.labels, args.clusters, result.centroids)
+
+    output = args.output or os.path.splitext(args.input)[0] + "_kmeans.npz"
+    np.savez(output, labels=result.labels, centroids=result.centroids, sizes=stats.sizes,
+             inertia=stats.inertia, radius=stats.radius, bbox_min=stats.bbox_min, bbox_max=stats.bbox_max)
+    summary = summarize(result, stats, len(points), seconds)
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(f"{len(points)} points, k={args.clusters}: inertia {result.inertia:.6g} after {result.n_iter} "
+          f"iteration(s) in {seconds:.3f}s -> {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+from .constants import COLOR, GRID_CELL_SIZE
+from .spatialgrid import SpatialGrid
+from .utils import show_msg, LEVEL
+import numpy as np
+
+class PointStore:
+    """
+    Growable, array-backed storage for canvas points.
+    Coordinates live in a float32 (n, 2) column, colors in a uint8 column of
+    indices into a shared palette and cluster labels in an int16 column (-1 when
+    unassigned), so the whole set can be handed to numpy without copying.
+    A SpatialGrid is kept alongside for radius queries (hover, picking, erasing).
+    `revision` is bumped by every change except appends, so caches built over the
+    points only need to process the appended tail while it stays the same.
+    """
+    MAX_PALETTE_SIZE = 256
+
+    def __init__(self, capacity: int = 1024, default_color: tuple[int, int, int] = COLOR["black"]):
+        self._xy = np.empty((max(capacity, 1), 2), dtype=np.float32)
+        self._colors = np.empty(max(capacity, 1), dtype=np.uint8)
+        self._labels = np.empty(max(capacity, 1), dtype=np.int16)
+        self._n = 0
+        self.revision = 0
+        self.index = SpatialGrid(GRID_CELL_SIZE)
+        self.palette: list[tuple[int, int, int]] = []
+        self._palette_index: dict[tuple[int, int, int], int] = {}
+        self.default_color_id = self.color_id(default_color)
+
+    # ======= Palette =======
+    def color_id(self, color: tuple[int, int, int]) -> int:
+        """Return the palette index of a color, registering it if needed."""
+        color = tuple(color)
+        idx = self._palette_index.get(color)
+        if idx is None:
+            if len(self.palette) >= self.MAX_PALETTE_SIZE:
+                show_msg(LEVEL["WARNING"], f"Palette is full, using default color for {color}.")
+                return self.default_color_id
+            idx = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = idx
+        return idx
+
+    def color_ids(self, colors) -> np.ndarray:
+        """Return palette indices for a sequence of colors."""
+        return np.array([self.color_id(c) for c in colors], dtype=np.uint8)
+
+    # ======= Columns =======
+    @property
+    def xy(self) -> np.ndarray:
+        """(n, 2) view of the point coordinates."""
+        return self._xy[:self._n]
+
+    @property
+    def colors(self) -> np.ndarray:
+        """(n,) view of the point palette indices."""
+        return self._colors[:self._n]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """(n,) view of the point cluster labels."""
+        return self._labels[:self._n]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._colors)
+
+    def _reserve(self, size: int) -> None:
+        if size <= self.capacity:
+            return
+        new_capacity = max(size, self.capacity * 2)
+        xy = np.empty((new_capacity, 2), dtype=np.float32)
+        colors = np.empty(new_capacity, dtype=np.uint8)
+        labels = np.empty(new_capacity, dtype=np.int16)
+        xy[:self._n] = self._xy[:self._n]
+        colors[:self._n] = self._colors[:self._n]
+        labels[:self._n] = self._labels[:self._n]
+        self._xy, self._colors, self._labels = xy, colors, labels
+
+    # ======= Mutation =======
+    def append(self, x: float, y: float, color_id: int | None = None, label: int = -1) -> None:
+        """Append a point in amortized O(1)."""
+        self._reserve(self._n + 1)
+        self._xy[self._n] = (x, y)
+        self._colors[self._n] = self.default_color_id if color_id is None else color_id
+        self._labels[self._n] = label
+        self._n += 1
+
+    def extend(self, xy, color_ids=None, labels=None) -> None:
+        """Append many points at once."""
+        xy = np.asarray(xy, dtype=np.float32).reshape(-1, 2)
+        count = len(xy)
+        self._reserve(self._n + count)
+        self._xy[self._n:self._n + count] = xy
+        self._colors[self._n:self._n + count] = self.default_color_id if color_ids is None else color_ids
+        self._labels[self._n:self._n + count] = -1 if labels is None else labels
+        self._n += count
+
+    def pop(self) -> tuple[float, float, tuple[int, int, int]] | None:
+        """Remove and return the last point in O(1)."""
+        if self._n == 0:
+            return None
+        point = self[self._n - 1]
+        self._n -= 1
+        self.revision += 1
+        self.index.truncate(self._n)
+        return point
+
+    def remove_mask(self, mask: np.ndarray) -> int:
+        """Remove every point where mask is True, preserving order. Returns the removed count."""
+        keep = ~np.asarray(mask, dtype=bool)
+        kept = int(keep.sum())
+        removed = self._n - kept
+        if removed:
+            self._xy[:kept] = self.xy[keep]
+            self._colors[:kept] = self.colors[keep]
+            self._labels[:kept] = self.labels[keep]
+            self._n = kept
+            self.revision += 1
+            self.index.invalidate()
+        return removed
+
+    def near(self, pos: tuple[int, int], radius: float, inclusive: bool = False) -> np.ndarray:
+        """Sorted indices of points within radius of pos, found through the spatial index."""
+        return self.index.within(self.xy, pos, radius, inclusive)
+
+    def remove_near(self, pos: tuple[int, int], radius: float) -> int:
+        """Remove points within radius of pos (inclusive). Returns the removed count."""
+        idx = self.near(pos, radius, inclusive=True)
+        if len(idx) == 0:
+            return 0
+        mask = np.zeros(self._n, dtype=bool)
+        mask[idx] = True
+        return self.remove_mask(mask)
+
+    def set_color(self, index: int, color_id: int) -> None:
+        self._colors[index] = color_id
+        self.revision += 1
+
+    def set_colors(self, color_ids) -> None:
+        """Overwrite the whole color column."""
+        self._colors[:self._n] = color_ids
+        self.revision += 1
+
+    def set_labels(self, labels) -> None:
+        """Overwrite the whole label column."""
+        self._labels[:self._n] = labels
+        self.revision += 1
+
+    def clear(self) -> None:
+        self._n = 0
+        self.revision += 1
+        self.index.invalidate()
+
+    # ======= Sequence protocol =======
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index: int) -> tuple[float, float, tuple[int, int, int]]:
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("point index out of range")
+        x, y = self._xy[index]
+        return float(x), float(y), self.palette[self._colors[index]]
+
+    def __iter__(self):
+        palette = self.palette
+        for (x, y), c in zip(self.xy.tolist(), self.colors.tolist()):
+            yield x, y, palette[c]
@@ -0,0 +1,87 @@
+"""
+Background warm-up of the clustering and boundary code, so the first Run or boundary
+toggle is as fast as any later one.
+"""
+from .constants import KMEANS
+from .utils import show_msg, LEVEL
+import importlib
+import threading
+import time
+
+class Prewarmer:
+    """
+    Imports the k-means engine, runs a tiny fit with the configured backend, starts the
+    restart process pool when the n_points already loaded are enough for parallel fits, and
+    touches the geometry helpers, all on a daemon thread. The time of each step is kept in
+    timings. Clicked-in points never reach parallel_min_points, so by default no worker
+    processes are spawned; fits on data loaded later start the pool on first use.
+    """
+    def __init__(self, backend: str = KMEANS["backend"], n_jobs: int = KMEANS["n_jobs"], n_points: int = 0):
+        self.backend = backend
+        self.n_jobs = n_jobs
+        self.n_points = n_points
+        self.timings: dict[str, float] = {}
+        self._thread = None
+
+    def _step(self, name: str, fn) -> None:
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            # warming is best effort; the real call reports the error when it happens
+            show_msg(LEVEL["WARNING"], f"Pre-warming {name} failed: {e}")
+            return
+        self.timings[name] = time.perf_counter() - start
+
+    def _fit(self) -> None:
+        from .kmeans import KMeans
+        import numpy as np
+        data = np.random.default_rng(0).uniform(0, 600, (64, 2)).astype(np.float32)
+        KMeans(3, n_init=2, seed=0, backend=self.backend, n_jobs=1).fit(data)
+
+    def _pool_jobs(self) -> int:
+        """Workers the first fit would use, or 0 when it runs in-process."""
+        from .kmeans.parallel import resolve_n_jobs
+        if self.n_points < KMEANS["parallel_min_points"]:
+            return 0
+        n_jobs = min(resolve_n_jobs(self.n_jobs), KMEANS["n_init"])
+        return n_jobs if n_jobs > 1 else 0
+
+    def _pool(self) -> None:
+        from .kmeans.parallel import get_pool, resolve_n_jobs
+        n_jobs = self._pool_jobs()
+        # one task per worker, so every spawned process has imported the engine before the first fit
+        pool = get_pool(n_jobs)
+        for future in [pool.submit(resolve_n_jobs, 1) for _ in range(n_jobs)]:
+            future.result()
+
+    def _geometry(self) -> None:
+        from .geometry import convex_hull, nearest_centroid_grid
+        import numpy as np
+        points = np.random.default_rng(0).uniform(0, 64, (32, 2))
+        convex_hull(points)
+        nearest_centroid_grid((64, 64), points[:3])
+
+    def _run(self) -> None:
+        self._step("import", lambda: importlib.import_module(".kmeans", __package__))
+        self._step("fit", self._fit)
+        if self._pool_jobs():
+            self._step("process pool", self._pool)
+        self._step("geometry", self._geometry)
+        show_msg(LEVEL["SUCCESS"], f"Pre-warmed clustering: {self.summary()}")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="prewarm", daemon=True)
+            self._thread.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def done(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def summary(self) -> str:
+        return ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.timings.items())
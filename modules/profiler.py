@@ -0,0 +1,123 @@
+"""
+Per-phase frame timing kept in fixed-size ring buffers.
+The main loop calls begin_frame(), then lap(phase) after each phase, then end_frame(); a
+disabled profiler returns from each of these before reading the clock.
+"""
+from .constants import PROFILER
+import csv
+import json
+import os
+import time
+import numpy as np
+
+class RingBuffer:
+    """The last capacity float samples, oldest first from values()."""
+    def __init__(self, capacity: int):
+        self._data = np.zeros(capacity)
+        self._i = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, value: float) -> None:
+        self._data[self._i] = value
+        self._i = (self._i + 1) % len(self._data)
+        self._n = min(self._n + 1, len(self._data))
+
+    def values(self) -> np.ndarray:
+        if self._n < len(self._data):
+            return self._data[:self._n].copy()
+        return np.roll(self._data, -self._i)
+
+class FrameProfiler:
+    FRAME = "frame"  # work time of the whole frame, next to its phases
+
+    def __init__(self, capacity: int = PROFILER["capacity"], enabled: bool = PROFILER["enabled"]):
+        self.capacity = capacity
+        self.enabled = enabled
+        self._phases = {self.FRAME: RingBuffer(capacity)}   # laps, one sample per frame
+        self._samples: dict[str, RingBuffer] = {}               # record(), one sample per occurrence
+        self._intervals = RingBuffer(capacity)
+        self._current: dict[str, float] = {}
+        self._start = self._last = self._previous_start = None
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap to phase; repeated laps in a frame add up."""
+        if not self.enabled or self._start is None:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        if not self.enabled or self._start is None:
+            return
+        now = time.perf_counter()
+        current = self._current
+        for phase in current:
+            if phase not in self._phases:
+                self._phases[phase] = RingBuffer(self.capacity)
+        # phases skipped this frame (e.g. an undirty canvas) count as 0
+        for phase, ring in self._phases.items():
+            if phase != self.FRAME:
+                ring.append(current.get(phase, 0.0))
+        self._phases[self.FRAME].append(now - self._start)
+        if self._previous_start is not None:
+            self._intervals.append(self._start - self._previous_start)
+        self._previous_start = self._start
+        current.clear()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one timing that is not part of a frame, e.g. a background fit."""
+        if not self.enabled:
+            return
+        self._samples.setdefault(name, RingBuffer(self.capacity)).append(seconds)
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        # a frame running while the profiler was toggled is dropped, as is the pause in between
+        self._start = self._previous_start = None
+        self._current.clear()
+
+    @property
+    def fps(self) -> float:
+        intervals = self._intervals.values()
+        return 1 / intervals.mean() if len(intervals) and intervals.mean() > 0 else 0.0
+
+    def has_samples(self) -> bool:
+        return any(len(ring) for ring in (*self._phases.values(), *self._samples.values()))
+
+    def series(self) -> dict[str, np.ndarray]:
+        """Samples in seconds: the frame, its phases in first-seen order, then every record() name."""
+        return {name: ring.values() for name, ring in (*self._phases.items(), *self._samples.items())}
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """p50, p95 and max in milliseconds per series."""
+        result = {}
+        for name, values in self.series().items():
+            if len(values):
+                p50, p95 = np.percentile(values, [50, 95]) * 1000
+                result[name] = {"p50": float(p50), "p95": float(p95), "max": float(values.max()) * 1000,
+                                "n": len(values)}
+        return result
+
+    def export(self, path: str) -> None:
+        """Write every sample (ms) to path: one row per sample for .csv, samples and summary for .json."""
+        series = self.series()
+        if os.path.splitext(path)[1].lower() == ".json":
+            with open(path, "w") as f:
+                json.dump({"fps": self.fps, "summary": self.summary(),
+                           "samples_ms": {name: (values * 1000).tolist() for name, values in series.items()}},
+                          f, indent=2)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "sample", "ms"])
+            for name, values in series.items():
+                writer.writerows((name, i, f"{ms:.4f}") for i, ms in enumerate(values * 1000))
@@ -0,0 +1,64 @@
+from .uielement import UIElement
+import pygame
+
+class RetainedRenderer:
+    """
+    Redraws only the UI elements that changed and pushes just their rectangles to the display.
+    Each frame gets the full, ordered element list; anything not dirty keeps its pixels from
+    the previous frame, so an idle frame draws nothing and skips the display update.
+    """
+    def __init__(self, screen: pygame.Surface, background: tuple[int, int, int]):
+        self.screen = screen
+        self.background = background
+        self._drawn: dict[UIElement, pygame.Rect] = {}
+        self._full = True
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame, e.g. after the window was exposed."""
+        self._full = True
+
+    def _damage(self, elements: list[UIElement]) -> list[pygame.Rect]:
+        """Rectangles to repaint: old and new area of dirty elements plus removed elements."""
+        current = set(elements)
+        damaged = [rect for element, rect in self._drawn.items() if element not in current]
+        for element in elements:
+            if element.dirty:
+                old = self._drawn.get(element)
+                damaged.append(element.rect.union(old) if old else element.rect.copy())
+        if not damaged:
+            return damaged
+        # clean elements overlapping the damage are repainted whole, so their area joins it
+        grown = True
+        while grown:
+            grown = False
+            for element in elements:
+                rect = self._drawn.get(element, element.rect)
+                if rect.collidelist(damaged) != -1 and not any(r.contains(rect) for r in damaged):
+                    damaged.append(rect.union(element.rect))
+                    grown = True
+        return damaged
+
+    def render(self, elements: list[UIElement]) -> list[pygame.Rect]:
+        """Draw the frame. Returns the rectangles that were pushed to the display."""
+        screen = self.screen
+        if self._full:
+            screen.fill(self.background)
+            for element in elements:
+                element.draw(screen)
+                element.mark_clean()
+            self._drawn = {element: element.rect.copy() for element in elements}
+            self._full = False
+            pygame.display.flip()
+            return [screen.get_rect()]
+        damaged = self._damage(elements)
+        if not damaged:
+            return damaged
+        for rect in damaged:
+            screen.fill(self.background, rect)
+        for element in elements:
+            if element.dirty or element.rect.collidelist(damaged) != -1:
+                element.draw(screen)
+                element.mark_clean()
+        self._drawn = {element: element.rect.copy() for element in elements}
+        pygame.display.update(damaged)
+        return damaged
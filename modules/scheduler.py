@@ -0,0 +1,57 @@
+from .constants import SCHEDULER
+import pygame
+import time
+
+class FrameScheduler:
+    """
+    Decides how long the main loop sleeps between frames.
+    While events arrive or work is running it paces frames at max_fps; after idle_after_ms
+    without either it waits for the next event, waking at most idle_fps times a second.
+    Only drivers in NATIVE_WAIT_DRIVERS block in pygame.event.wait: SDL emulates it on the
+    others by polling every millisecond, which costs more CPU than plain 60 fps frames, so
+    there the scheduler sleeps idle_poll_ms at a time and checks the queue in between.
+    """
+    # video drivers whose SDL backend sleeps in WaitEventTimeout instead of polling
+    NATIVE_WAIT_DRIVERS = {"x11", "wayland", "windows", "cocoa"}
+
+    def __init__(self, max_fps: int = SCHEDULER["max_fps"], idle_fps: float = SCHEDULER["idle_fps"],
+                 idle_after_ms: int = SCHEDULER["idle_after_ms"], idle_poll_ms: int = SCHEDULER["idle_poll_ms"]):
+        self.max_fps = max_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after_ms / 1000
+        self.idle_poll = idle_poll_ms / 1000
+        self.native_wait = pygame.display.get_driver() in self.NATIVE_WAIT_DRIVERS
+        self.clock = pygame.time.Clock()
+        self._last_activity = time.perf_counter()
+
+    @property
+    def idle(self) -> bool:
+        return time.perf_counter() - self._last_activity >= self.idle_after
+
+    def wake(self) -> None:
+        """Note activity that did not come through the event queue."""
+        self._last_activity = time.perf_counter()
+
+    def events(self, busy: bool = False) -> list[pygame.event.Event]:
+        """Events for the next frame; blocks until one arrives when idle and not busy."""
+        if busy:
+            self.wake()
+        if self.idle and self.native_wait:
+            event = pygame.event.wait(int(1000 / self.idle_fps))
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+        elif self.idle:
+            deadline = time.perf_counter() + 1 / self.idle_fps
+            events = pygame.event.get()
+            while not events and time.perf_counter() < deadline:
+                time.sleep(self.idle_poll)
+                events = pygame.event.get()
+        else:
+            events = pygame.event.get()
+        if events:
+            self.wake()
+        return events
+
+    def tick(self) -> None:
+        """Cap the frame rate; a frame that just woke from an idle wait does not sleep again."""
+        self.clock.tick(self.max_fps)
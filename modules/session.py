@@ -0,0 +1,67 @@
+"""
+Canvas sessions saved as a directory bundle: a small header.json next to one raw .npy per
+column, so large point sets load memory-mapped instead of being parsed.
+"""
+from .utils import show_msg, LEVEL
+import json
+import os
+import shutil
+import numpy as np
+
+FORMAT = "kmeans-visualizer-session"
+VERSION = 1
+HEADER = "header.json"
+
+def is_session(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, HEADER))
+
+def save_session(canvas, path: str) -> None:
+    """Write the canvas points, colors, labels and centroids to the bundle directory at path."""
+    if os.path.exists(path) and not is_session(path):
+        raise ValueError(f"'{path}' exists and is not a session")
+    points = canvas.points
+    centroids = getattr(canvas, "centroids", None)
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "n_points": len(points),
+        "palette": [list(c) for c in points.palette],
+        "k": None if centroids is None else len(centroids),
+        "boundary_mode": canvas.boundary_mode,
+    }
+    # written next to the target and swapped in, so a failed save keeps the previous session
+    tmp = path.rstrip("/\\") + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    np.save(os.path.join(tmp, "xy.npy"), points.xy)
+    np.save(os.path.join(tmp, "colors.npy"), points.colors)
+    np.save(os.path.join(tmp, "labels.npy"), points.labels)
+    if centroids is not None:
+        np.save(os.path.join(tmp, "centroids.npy"), np.asarray(centroids, dtype=np.float64))
+    with open(os.path.join(tmp, HEADER), "w") as f:
+        json.dump(header, f, indent=2)
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+    show_msg(LEVEL["SUCCESS"], f"Saved {len(points)} point(s) to {path}")
+
+def load_session(canvas, path: str) -> dict:
+    """Replace the canvas content with a saved session without re-running k-means. Returns the header."""
+    with open(os.path.join(path, HEADER)) as f:
+        header = json.load(f)
+    if header.get("format") != FORMAT or header.get("version", 0) > VERSION:
+        raise ValueError(f"'{path}' is not a supported session (format {header.get('format')!r}, "
+                         f"version {header.get('version')!r})")
+    load = lambda name: np.load(os.path.join(path, name), mmap_mode="r")
+    xy, colors, labels = load("xy.npy"), load("colors.npy"), load("labels.npy")
+    if not len(xy) == len(colors) == len(labels) == header["n_points"]:
+        raise ValueError(f"'{path}' is inconsistent: column lengths differ from the header")
+    canvas.clear_points()
+    # saved palette indices are remapped to this store's palette with one lookup table
+    remap = canvas.points.color_ids([tuple(c) for c in header["palette"]])
+    canvas.points.extend(xy, remap[colors] if len(remap) else None, labels)
+    canvas.version += 1
+    canvas.boundary_mode = header.get("boundary_mode")
+    if header.get("k"):
+        canvas.set_clusters(load("centroids.npy"))
+    return header
@@ -0,0 +1,104 @@
+import numpy as np
+
+class SpatialGrid:
+    """
+    Uniform-grid index over a point array for radius queries.
+    Points are bucketed by cell with a counting sort, so a query only looks at the
+    cells its radius overlaps. Points appended after the last build are kept in a
+    short pending tail and scanned directly until the next (amortized) rebuild.
+    """
+    MIN_PENDING = 1024
+
+    def __init__(self, cell_size: float = 10):
+        self.cell_size = float(cell_size)
+        self._cell = self.cell_size
+        self._order = np.empty(0, dtype=np.int64)
+        self._starts = np.zeros(1, dtype=np.int64)
+        self._origin = (0.0, 0.0)
+        self._dims = (0, 0)
+        self._built_n = 0
+        self._valid = False
+
+    def invalidate(self) -> None:
+        """Mark the index stale, e.g. after points were removed from the middle."""
+        self._valid = False
+
+    def truncate(self, n: int) -> None:
+        """Forget indices >= n after points were popped from the end."""
+        self._built_n = min(self._built_n, n)
+
+    def _cell_coords(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        w, h = self._dims
+        # clipping before the cast makes truncation act as floor
+        fx = (xy[:, 0] - self._origin[0]) / self._cell
+        fy = (xy[:, 1] - self._origin[1]) / self._cell
+        np.clip(fx, 0, w - 1, out=fx)
+        np.clip(fy, 0, h - 1, out=fy)
+        return fx.astype(np.int32), fy.astype(np.int32)
+
+    def rebuild(self, xy: np.ndarray) -> None:
+        n = len(xy)
+        self._built_n = n
+        self._valid = True
+        if n == 0:
+            self._order = np.empty(0, dtype=np.int64)
+            self._starts = np.zeros(1, dtype=np.int64)
+            self._dims = (0, 0)
+            return
+        # per-column reductions are much faster than axis=0 on an (n, 2) array
+        lo = np.array([xy[:, 0].min(), xy[:, 1].min()], dtype=np.float64)
+        hi = np.array([xy[:, 0].max(), xy[:, 1].max()], dtype=np.float64)
+        cell = self.cell_size
+        # keep the cell table proportional to the point count for sparse, spread-out data
+        max_cells = max(4096, 4 * n)
+        while ((hi[0] - lo[0]) // cell + 1) * ((hi[1] - lo[1]) // cell + 1) > max_cells:
+            cell *= 2
+        self._cell = cell
+        self._origin = (lo[0], lo[1])
+        self._dims = (int((hi[0] - lo[0]) // cell) + 1, int((hi[1] - lo[1]) // cell) + 1)
+        cx, cy = self._cell_coords(xy)
+        ids = cy * np.int32(self._dims[0]) + cx
+        n_cells = self._dims[0] * self._dims[1]
+        # a stable sort on small integer keys is a radix sort in numpy
+        key_type = np.uint16 if n_cells <= np.iinfo(np.uint16).max else np.uint32
+        self._order = np.argsort(ids.astype(key_type), kind="stable")
+        self._starts = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ids, minlength=n_cells), out=self._starts[1:])
+
+    def candidates(self, xy: np.ndarray, pos: tuple[float, float], radius: float) -> np.ndarray:
+        """Indices of points that may lie within radius of pos (a superset of the answer)."""
+        n = len(xy)
+        if not self._valid or n - self._built_n > max(self.MIN_PENDING, self._built_n // 8):
+            self.rebuild(xy)
+        parts = []
+        built_n = self._built_n
+        if built_n and self._dims[0]:
+            w = self._dims[0]
+            # pad by a hair so float32 rounding of stored points cannot push one out of range
+            r = radius + 1e-3 * self._cell
+            corners = np.array([[pos[0] - r, pos[1] - r], [pos[0] + r, pos[1] + r]])
+            cx, cy = self._cell_coords(corners)
+            cx0, cx1, cy0, cy1 = int(cx[0]), int(cx[1]), int(cy[0]), int(cy[1])
+            starts, order = self._starts, self._order
+            for cy in range(cy0, cy1 + 1):
+                # cells of one row are contiguous in the sorted order
+                row = order[starts[cy * w + cx0]:starts[cy * w + cx1 + 1]]
+                parts.append(row if built_n == len(order) else row[row < built_n])
+        if n > built_n:
+            parts.append(np.arange(built_n, n))
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def within(self, xy: np.ndarray, pos: tuple[float, float], radius: float,
+               inclusive: bool = False) -> np.ndarray:
+        """Sorted indices of points within radius of pos."""
+        idx = self.candidates(xy, pos, radius)
+        if len(idx) == 0:
+            return idx
+        pts = xy[idx]
+        dx = pts[:, 0] - pos[0]
+        dy = pts[:, 1] - pos[1]
+        d2 = dx * dx + dy * dy
+        hit = d2 <= radius * radius if inclusive else d2 < radius * radius
+        return np.sort(idx[hit])
@@ -28,13 +28,13 @@ class Signal:
 
     def emit(self, *args, **kwargs) -> None:
             """Emit events with error handling."""
-            for event, callbacks in self._events.items():
-                if event in kwargs:
-                    for callback in callbacks:
-                        try:
-                            callback(*args, **kwargs[event])
-                        except Exception as e:
-                            show_msg(LEVEL["ERROR"], f"Error in {event} callback: {str(e)}")
+            # looked up by name, so an emit costs the events it names, not every event type
+            for event, params in kwargs.items():
+                for callback in self._events.get(event, ()):
+                    try:
+                        callback(*args, **params)
+                    except Exception as e:
+                        show_msg(LEVEL["ERROR"], f"Error in {event} callback: {str(e)}")
 
     def disconnect(self, event: str, callback: callable) -> None:
         """Disconnect a callback from an event."""
@@ -94,9 +94,26 @@ class UIElement(ABC):
         self._focused = False
         self._hovered = False
         self._active = False
+        # set when the element must be redrawn; cleared by the renderer after drawing it
+        self._dirty = True
         # signal
         self.signal = Signal()
 
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+    @property
+    def dirty(self) -> bool:
+        """True if the element changed since it was last drawn."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+
     @property
     def enabled(self) -> bool:
         return self._enabled
@@ -104,6 +121,7 @@ class UIElement(ABC):
     @enabled.setter
     def enabled(self, flag: bool) -> None:
         self._enabled = flag
+        self._dirty = True
         if flag:
             self.color = self._original_color
             self._active = False
@@ -124,6 +142,7 @@ class UIElement(ABC):
             show_msg(LEVEL["ERROR"], "Invalid parameter type for center_on. Expected pygame.Surface, pygame.Rect or tuple.")
             return self
         self.position = self._rect.topleft
+        self._dirty = True
         return self
 
     def _center_x(self, param) -> Self:
@@ -133,6 +152,7 @@ class UIElement(ABC):
             return self
         self._rect.centerx = param
         self.position = self._rect.topleft
+        self._dirty = True
         return self
 
     def _center_y(self, param) -> Self:
@@ -142,6 +162,7 @@ class UIElement(ABC):
             return self
         self._rect.centery = param
         self.position = self._rect.topleft
+        self._dirty = True
         return self
 
     def _set_position(self, position) -> Self:
@@ -151,20 +172,22 @@ class UIElement(ABC):
             return self
         self._rect.topleft = position
         self.position = position
+        self._dirty = True
         return self
 
     def _update_color_state(self) -> None:
         """Update the element's color based on its current state."""
+        previous = self.color
         if not self._enabled:
             self.color = self.disabled_color
-            return
-            
-        if self._active:
+        elif self._active:
             self.color = self.active_color
         elif self._hovered:
             self.color = self.hover_color
         else:
             self.color = self._original_color
+        if self.color != previous:
+            self._dirty = True
 
     def update(self, mouse_pos) -> None:
         """Update the UI element's state."""
@@ -199,12 +222,14 @@ class UIElement(ABC):
             show_msg(LEVEL["ERROR"], "Invalid type for move. Expected int or float.")
             return
         self._rect = self._rect.move(dx, dy)
+        self._dirty = True
 
     def move_ip(self, dx, dy) -> Self:
         if not isinstance(dx, (int, float)) or not isinstance(dy, (int, float)):
             show_msg(LEVEL["ERROR"], "Invalid type for move_ip. Expected int or float.")
             return self
         self._rect.move_ip(dx, dy)
+        self._dirty = True
         return self
 
     def connect(self, event: str, callback: callable) -> None:
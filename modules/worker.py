@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from .kmeans import FitCancelled
+import threading
+import time
+import pygame
+
+# Posted to the pygame queue when a clustering job finishes.
+# Attributes: job_id, result (or None), error (or None), payload, seconds (run time of the job).
+KMEANS_DONE = pygame.event.custom_type()
+
+class ClusterWorker:
+    """
+    Runs clustering jobs off the event loop, one at a time.
+    Submitting a job cancels the previous one; results come back as KMEANS_DONE events.
+    The numpy inner loops release the GIL, so a thread keeps the UI responsive.
+    """
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kmeans")
+        self._job_id = 0
+        self._cancel_event = None
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._cancel_event is not None
+
+    def submit(self, fn, *args, payload=None, **kwargs) -> int:
+        """Run fn(*args, should_stop=..., **kwargs) in the background and return its job id."""
+        with self._lock:
+            self._cancel_locked()
+            self._job_id += 1
+            job_id = self._job_id
+            cancel_event = threading.Event()
+            self._cancel_event = cancel_event
+        self._executor.submit(self._run, job_id, cancel_event, fn, args, kwargs, payload)
+        return job_id
+
+    def _run(self, job_id, cancel_event, fn, args, kwargs, payload) -> None:
+        result, error = None, None
+        start = time.perf_counter()
+        try:
+            result = fn(*args, should_stop=cancel_event.is_set, **kwargs)
+        except FitCancelled:
+            return
+        except Exception as e:
+            error = e
+        with self._lock:
+            if cancel_event.is_set():
+                return
+            self._cancel_event = None
+        pygame.event.post(pygame.event.Event(KMEANS_DONE, job_id=job_id, result=result,
+                                             error=error, payload=payload,
+                                             seconds=time.perf_counter() - start))
+
+    def is_current(self, job_id: int) -> bool:
+        """Whether a finished job is still the latest one submitted."""
+        return job_id == self._job_id
+
+    def _cancel_locked(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def cancel(self) -> None:
+        """Cancel the running job, if any. Its result will never be delivered."""
+        with self._lock:
+            self._cancel_locked()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,22 @@
+from modules.kmeans.hamerly import hamerly
+from modules.kmeans.lloyd import lloyd
+from modules.kmeans.seeding import kmeans_plusplus
+import numpy as np
+import pytest
+
+def blobs(n: int, k: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 600, (k, 2))
+    return centers[rng.integers(k, size=n)] + rng.normal(0, 30, (n, 2))
+
+@pytest.mark.parametrize("seed, k", [(0, 3), (1, 8), (2, 15)])
+def test_hamerly_matches_lloyd(seed, k):
+    data = blobs(5000, k, seed)
+    init = kmeans_plusplus(data, k, np.random.default_rng(seed))
+    centroids, labels, inertia, n_iter = lloyd(data, init, max_iter=100, tol_abs=0)
+    h_centroids, h_labels, h_inertia, h_n_iter, n_skipped = hamerly(data, init, max_iter=100, tol_abs=0)
+    np.testing.assert_array_equal(h_labels, labels)
+    np.testing.assert_allclose(h_centroids, centroids, rtol=1e-9, atol=1e-9)
+    assert h_inertia == pytest.approx(inertia, rel=1e-9)
+    assert h_n_iter == n_iter
+    assert n_skipped > 0
@@ -0,0 +1,46 @@
+from modules.pointstore import PointStore
+from modules.spatialgrid import SpatialGrid
+import numpy as np
+import pytest
+
+def linear_within(xy: np.ndarray, pos, radius: float, inclusive: bool = False) -> np.ndarray:
+    d2 = ((xy.astype(np.float64) - pos) ** 2).sum(axis=1)
+    return np.flatnonzero(d2 <= radius * radius if inclusive else d2 < radius * radius)
+
+def check_queries(store: PointStore, rng: np.random.Generator) -> None:
+    for _ in range(8):
+        pos = tuple(rng.uniform(-20, 620, 2))
+        radius = float(rng.choice([0.5, 5, 30, 150]))
+        inclusive = bool(rng.integers(2))
+        np.testing.assert_array_equal(store.near(pos, radius, inclusive),
+                                      linear_within(store.xy, pos, radius, inclusive))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_near_matches_linear_scan_after_edits(seed):
+    rng = np.random.default_rng(seed)
+    store = PointStore(capacity=16)
+    for _ in range(150):
+        edit = rng.integers(6)
+        if edit == 0:
+            for x, y in rng.uniform(0, 600, (int(rng.integers(1, 50)), 2)):
+                store.append(x, y)
+        elif edit == 1:
+            for _ in range(int(rng.integers(1, 20))):
+                store.pop()
+        elif edit == 2:
+            # clustered batches exercise the coarser cells picked for large, spread-out sets
+            center = rng.uniform(0, 600, 2)
+            store.extend(center + rng.normal(0, rng.choice([2, 50]), (int(rng.integers(1, 2000)), 2)))
+        elif edit == 3 and len(store):
+            store.remove_mask(rng.random(len(store)) < 0.1)
+        elif edit == 4 and len(store):
+            store.remove_near(tuple(rng.uniform(0, 600, 2)), float(rng.uniform(5, 80)))
+        elif edit == 5 and rng.random() < 0.1:
+            store.clear()
+        check_queries(store, rng)
+
+def test_within_on_points_exactly_on_the_radius():
+    grid = SpatialGrid(cell_size=10)
+    xy = np.array([[0, 0], [10, 0], [0, 10], [7, 7], [20, 20]], dtype=np.float32)
+    np.testing.assert_array_equal(grid.within(xy, (0, 0), 10), [0, 3])
+    np.testing.assert_array_equal(grid.within(xy, (0, 0), 10, inclusive=True), [0, 1, 2, 3])
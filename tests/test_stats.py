@@ -0,0 +1,27 @@
+from modules.kmeans.stats import cluster_stats
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cluster_stats_match_per_cluster_scan(seed):
+    rng = np.random.default_rng(seed)
+    k = int(rng.integers(1, 8))
+    data = rng.uniform(0, 600, (500, 2)).astype(np.float32)
+    # -1 marks unassigned points; some clusters may end up empty
+    labels = rng.integers(-1, k, len(data)).astype(np.int16)
+    centroids = rng.uniform(0, 600, (k, 2))
+    for given in (centroids, None):
+        stats = cluster_stats(data, labels, k, given)
+        for c in range(k):
+            members = data[labels == c].astype(np.float64)
+            assert stats.sizes[c] == len(members)
+            if not len(members):
+                assert stats.inertia[c] == 0 and stats.radius[c] == 0 and np.isnan(stats.bbox_min[c]).all()
+                continue
+            center = members.mean(axis=0) if given is None else centroids[c]
+            np.testing.assert_allclose(stats.centroids[c], center)
+            d2 = ((members - center) ** 2).sum(axis=1)
+            assert stats.inertia[c] == pytest.approx(d2.sum(), rel=1e-9)
+            assert stats.radius[c] == pytest.approx(np.sqrt(d2.max()), rel=1e-5)
+            np.testing.assert_array_equal(stats.bbox_min[c], members.min(axis=0))
+            np.testing.assert_array_equal(stats.bbox_max[c], members.max(axis=0))